@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
+from aiohttp import CookieJar
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import CONF_HOSTNAME, CONF_PASSWORD, CONF_USERNAME, DOMAIN, LOGGER
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_HOSTNAME,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    CONFIG_CACHE_FILE,
+    DATA_SCHEDULER,
+    DOMAIN,
+    LOGGER,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
 from .coordinator import OrcaDataUpdateCoordinator
+from .entity_plan import plan_entities
 from .orca_api import OrcaApi
+from .scheduler import PollScheduler
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -20,6 +44,13 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Orca integration."""
+    async_setup_services(hass)
+    hass.data[DATA_SCHEDULER] = PollScheduler(UPDATE_INTERVAL.total_seconds())
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Orca from a config entry."""
     LOGGER.debug("Setting up Orca integration entry: %s", entry.title)
@@ -28,21 +59,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     user = entry.data[CONF_USERNAME]
     passwd = entry.data[CONF_PASSWORD]
 
-    orca_api = OrcaApi(user, passwd, host)
-    try:
-        await orca_api.initialize()
-    except Exception as err:
-        LOGGER.error("Failed to initialize Orca API: %s", err)
-        return False
-
-    coordinator = OrcaDataUpdateCoordinator(hass, orca_api)
-    await coordinator.async_config_entry_first_refresh()
+    # HA-managed session for this entry; IDALToken is kept in its cookie jar.
+    # Sessions of all entries share HA's connection pool, the cookie jars are
+    # separate as tokens of heat pumps behind one address would clash. The
+    # session is closed on unload (after async_unload_entry) and failed setup,
+    # otherwise every reload would leave one open until Home Assistant stops
+    session = async_create_clientsession(hass, cookie_jar=CookieJar(unsafe=True))
+    entry.async_on_unload(session.close)
+    orca_api = OrcaApi(
+        user,
+        passwd,
+        host,
+        session=session,
+        config_cache_path=Path(hass.config.path(STORAGE_DIR, CONFIG_CACHE_FILE)),
+    )
+    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, _storage_key(entry))
+    coordinator = OrcaDataUpdateCoordinator(hass, orca_api, store)
+
+    # with a stored layout entities are created right away, the device is read
+    # and its circuits re-probed in the background
+    if not (restored := await coordinator.async_restore()):
+        try:
+            await orca_api.initialize()
+        except Exception as err:
+            LOGGER.error("Failed to initialize Orca API: %s", err)
+            await orca_api.close()
+            return False
+
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except BaseException:
+            # logged in by initialize(), each setup retry would take another slot
+            await orca_api.close()
+            raise
+        # layout and values are restorable from now on, also after a crash
+        await coordinator.async_save()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # platforms only look up their entities, those without any are not set up
+    coordinator.entity_plan = plan_entities(
+        (tag_value.config for tag_value in coordinator.data.values()),
+        orca_api.available_circuits,
+    )
+    await hass.config_entries.async_forward_entry_setups(
+        entry, _platforms(coordinator)
+    )
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    hass.data[DATA_SCHEDULER].add(
+        entry.entry_id,
+        coordinator.async_refresh,
+        lambda coro, name: entry.async_create_background_task(hass, coro, name),
+    )
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_revalidate(), "orca_revalidate"
+        )
+
     return True
 
 
@@ -53,6 +128,27 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, _platforms(coordinator)
+    ):
+        # stop polling, also a poll in progress, before the API is closed
+        await hass.data[DATA_SCHEDULER].remove(entry.entry_id)
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.api.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored layout and snapshot of a deleted entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry)).async_remove()
+
+
+def _platforms(coordinator: OrcaDataUpdateCoordinator) -> list[Platform]:
+    """Platforms set up for the entry, those with planned entities."""
+    planned = coordinator.entity_plan.platforms
+    return [platform for platform in PLATFORMS if platform in planned]
+
+
+def _storage_key(entry: ConfigEntry) -> str:
+    return f"{DOMAIN}.{entry.entry_id}"
@@ -7,7 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, EXCLUDED_IDS
+from .const import DOMAIN
 from .coordinator import OrcaDataUpdateCoordinator
 from .entity import OrcaEntity
 
@@ -20,16 +20,10 @@ async def async_setup_entry(
     """Set up Orca binary sensors."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for unique_id, tag_value in coordinator.data.items():
-        if (
-            tag_value.config.type == "boolean"
-            and not tag_value.config.adjustable.enabled
-            and tag_value.config.id not in EXCLUDED_IDS
-        ):
-            entities.append(OrcaBinarySensor(coordinator, unique_id))
-
-    async_add_entities(entities)
+    async_add_entities(
+        OrcaBinarySensor(coordinator, unique_id)
+        for unique_id in coordinator.entity_plan.binary_sensors
+    )
 
 
 class OrcaBinarySensor(OrcaEntity, BinarySensorEntity):
@@ -18,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import CONF_LANGUAGE, DOMAIN, LANG_EN, LANG_SI, LOGGER
 from .coordinator import OrcaDataUpdateCoordinator
 from .entity import OrcaEntity
+from .entity_plan import ClimateKeys
 from .orca_api import CIRCUIT_NAME_MAP_SI
 
 # Mapping of Orca modes to HA modes
@@ -41,6 +42,9 @@ ACTION_MAPPING = {
     "defrost": HVACAction.HEATING,  # Treat defrost as heating for consistency
 }
 
+# Values read by OrcaClimate shared by both circuits, see ClimateKeys for the others
+SHARED_TRACKED_IDS = ("valve_pos", "current_state")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,14 +54,10 @@ async def async_setup_entry(
     """Set up the Orca climate platform."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # iterates thru integers representing available circuits, create separate climate entities for each circuit
-    # circuts 1 and 2 are used for room heating, usually floor and/or radiators
-    entities = [
-        OrcaClimate(coordinator, circuit_id)
-        for circuit_id in coordinator.api.available_circuits
-        if circuit_id in [1, 2]
-    ]
-    async_add_entities(entities)
+    # separate climate entities for each room heating circuit
+    async_add_entities(
+        OrcaClimate(coordinator, keys) for keys in coordinator.entity_plan.climates
+    )
 
 
 class OrcaClimate(OrcaEntity, ClimateEntity):
@@ -67,13 +67,17 @@ class OrcaClimate(OrcaEntity, ClimateEntity):
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.HEAT_COOL]
     _attr_target_temperature_step = 0.1
 
-    def __init__(self, coordinator: OrcaDataUpdateCoordinator, circuit_id: int) -> None:
+    def __init__(self, coordinator: OrcaDataUpdateCoordinator, keys: ClimateKeys) -> None:
         """Initialize the climate entity."""
-        self._circuit_id = circuit_id
-        super().__init__(coordinator, self._get_unique_id("hc_room_temp"))
+        self._keys = keys
+        super().__init__(
+            coordinator,
+            keys.room_temp,
+            tracked_ids=[*keys.tracked, *SHARED_TRACKED_IDS],
+        )
 
         # support for both languages
-        eng_name: str = self.coordinator.data.get(self._get_unique_id("hc_name")).value
+        eng_name: str = self.coordinator.data.get(keys.name).value
         if coordinator.config_entry.data.get(CONF_LANGUAGE, LANG_EN) == LANG_SI:
             self._attr_name = str(CIRCUIT_NAME_MAP_SI[eng_name]).title()
         else:
@@ -90,89 +94,82 @@ class OrcaClimate(OrcaEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._get_value("hc_room_temp")
+        return self._get_value(self._keys.room_temp)
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
         if not self._single_temp_in_use():
             return None
-        return self._get_value("hc_desired_day_temp")
+        return self._get_value(self._keys.desired_day_temp)
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the highbound target temperature."""
         if self._single_temp_in_use():
             return None
-        return self._get_value("hc_desired_day_temp")
+        return self._get_value(self._keys.desired_day_temp)
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the lowbound target temperature."""
         if self._single_temp_in_use():
             return None
-        return self._get_value("hc_desired_night_temp")
+        return self._get_value(self._keys.desired_night_temp)
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return hvac operation ie. heat, cool mode."""
-        is_on = self._get_value("hc_turned_on")
+        is_on = self._get_value(self._keys.turned_on)
         if not is_on:
             return HVACMode.OFF
 
-        mode_val = self._get_value("hc_mode")
+        mode_val = self._get_value(self._keys.mode)
         return MODE_MAPPING.get(mode_val, HVACMode.HEAT_COOL)
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current running hvac operation if supported."""
-        valve_status = self._get_value("valve_pos", convert_to_unique=False)
-        pump_running = self._get_value("hc_pump_status")  # on circuit level
+        valve_status = self._get_value("valve_pos")
+        pump_running = self._get_value(self._keys.pump_status)  # on circuit level
 
         # "room_heating" indicates heating circuit active (and not hot water)
         if valve_status == "room_heating" and pump_running:
-            hp_status = self._get_value("current_state", convert_to_unique=False)
+            hp_status = self._get_value("current_state")
             return ACTION_MAPPING.get(hp_status, HVACAction.IDLE)
         return HVACAction.IDLE
 
-    def _get_value(self, id_: str, convert_to_unique: bool = True) -> Any:
+    def _get_value(self, unique_id: str) -> Any:
         """Safe getter for mapped keys."""
-        if convert_to_unique:
-            id_ = self._get_unique_id(id_)
-        if id_ in self.coordinator.data:
-            return self.coordinator.data[id_].value
+        if (tag_value := self.coordinator.data.get(unique_id)) is not None:
+            return tag_value.value
         return None
 
-    def _get_unique_id(self, id_: str) -> str:
-        """Get the unique ID for a given tag ID based on circuit ID."""
-        return f"{id_}_{self._circuit_id}"
-
     def _single_temp_in_use(self) -> bool:
         """Check if we are in 24h regime. If yes, only single temp is used."""
-        if self._get_value("timer_programme") == "24h":
+        if self._get_value(self._keys.timer_programme) == "24h":
             # means timer (časovni program) is not used
             return True
         return False
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
+        keys = self._keys
+        values = {}
 
         if (temp_low := kwargs.get("target_temp_low")) is not None:
-            await self.coordinator.api.set_value_by_id(
-                self._get_unique_id("hc_desired_night_temp"), value=temp_low
-            )
+            values[keys.desired_night_temp] = temp_low
 
         if (temp_high := kwargs.get("target_temp_high")) is not None:
-            await self.coordinator.api.set_value_by_id(
-                self._get_unique_id("hc_desired_day_temp"), value=temp_high
-            )
+            values[keys.desired_day_temp] = temp_high
 
         if (temp := kwargs.get("temperature")) is not None:
-            await self.coordinator.api.set_value_by_id(
-                self._get_unique_id("hc_desired_day_temp"), value=temp
-            )
+            values[keys.desired_day_temp] = temp
 
-        await self.coordinator.async_request_refresh()
+        # single writeTags request for all setpoints, room setpoint follows them
+        await self.coordinator.async_set_values(
+            values, confirm=[keys.desired_room_temp]
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -181,11 +178,12 @@ class OrcaClimate(OrcaEntity, ClimateEntity):
             LOGGER.error("Unknown mode: %s", hvac_mode)
             return
 
+        keys = self._keys
         if val == "off":
-            await self.coordinator.api.set_value_by_id("hc_turned_on", False)
+            values = {keys.turned_on: False}
         else:
-            # Ensure On, then set mode
-            await self.coordinator.api.set_value_by_id("hc_turned_on", True)
-            await self.coordinator.api.set_value_by_id("hc_mode", val)
-
-        await self.coordinator.async_request_refresh()
+            # Ensure On, then set mode (written in this order in one request)
+            values = {keys.turned_on: True, keys.mode: val}
+        await self.coordinator.async_set_values(
+            values, confirm=[keys.mode, keys.desired_room_temp]
+        )
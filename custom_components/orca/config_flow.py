@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 import voluptuous as vol
@@ -9,12 +10,14 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import callback
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from .const import (
     CONF_HOSTNAME,
     CONF_LANGUAGE,
     CONF_PASSWORD,
     CONF_USERNAME,
+    CONFIG_CACHE_FILE,
     DOMAIN,
     LANG_EN,
     LANGUAGES,
@@ -47,10 +50,13 @@ class OrcaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             username = user_input[CONF_USERNAME]
             password = user_input[CONF_PASSWORD]
 
-            orca = OrcaApi(username, password, host)
             try:
-                await orca.initialize()
-                await orca.fetch_all()
+                cache_path = Path(self.hass.config.path(STORAGE_DIR, CONFIG_CACHE_FILE))
+                async with OrcaApi(
+                    username, password, host, config_cache_path=cache_path
+                ) as orca:
+                    await orca.initialize()
+                    await orca.fetch_all()
             except Exception as err:
                 LOGGER.error("Connection error: %s", err)
                 errors["base"] = str(err)
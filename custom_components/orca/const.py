@@ -1,5 +1,6 @@
 """Constants for the Orca integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 DOMAIN = "orca"
@@ -9,6 +10,34 @@ CONF_HOSTNAME = "hostname"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+# hass.data key of the PollScheduler shared by all entries, hass.data[DOMAIN]
+# only holds coordinators
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Compiled config.yml cache, stored in HA's storage directory
+CONFIG_CACHE_FILE = "orca.config_cache"
+
+# Per entry store with discovered circuits and the last good snapshot
+STORAGE_VERSION = 1
+# Snapshot is written by a poll at most this often (seconds), it only needs to
+# be roughly recent
+SNAPSHOT_SAVE_INTERVAL = 300
+
+# Minimum time between reads of a tag per poll_tier (config.yml).
+# "fast" tags are read on every poll, "static" ones only once after startup.
+POLL_TIER_INTERVALS: dict[str, timedelta | None] = {
+    "fast": timedelta(0),
+    "normal": timedelta(minutes=2),
+    "slow": timedelta(minutes=10),
+    "static": None,
+}
+
+# In-memory samples of tags with "history: true", at least an hour is needed to
+# aggregate hourly statistics; memory per tag is fixed at retention / UPDATE_INTERVAL
+HISTORY_RETENTION = timedelta(hours=2)
+
 CONF_LANGUAGE = "Language"
 LANG_EN = "English"
 LANG_SI = "Slovenščina"
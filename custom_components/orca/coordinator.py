@@ -2,37 +2,478 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import math
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.models.statistics import StatisticMeanType
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER
-from .orca_api import OrcaApi, OrcaTagValue
+from .const import (
+    CONF_LANGUAGE,
+    DOMAIN,
+    HISTORY_RETENTION,
+    LANG_SI,
+    LOGGER,
+    POLL_TIER_INTERVALS,
+    SNAPSHOT_SAVE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from .derived import DerivedMetrics
+from .entity_plan import EntityPlan
+from .history import TagHistory
+from .models import OrcaTagConfig
+from .orca_api import (
+    DeviceUnavailableError,
+    OrcaApi,
+    OrcaTagValue,
+    RequestPriority,
+    SampleWindow,
+    request_priority,
+)
+
+
+@dataclass
+class PollStats:
+    """Duration and cost of the coordinator's polls."""
+
+    polls: int = 0
+    failed_polls: int = 0
+    # seconds per poll, successful or not
+    duration: SampleWindow = field(default_factory=SampleWindow)
+    # success of the most recent polls, for the error rate
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=100))
+    # figures of the last poll
+    tags: int = 0
+    changed: int = 0
+    requests: int = 0
+    bytes_received: int = 0
+    invalid_values: int = 0
+    # values kept back by a deadband since start
+    suppressed_values: int = 0
+
+    @property
+    def error_rate(self) -> float | None:
+        """Percentage of failed polls among the most recent ones."""
+        if not self.outcomes:
+            return None
+        return round(100 * self.outcomes.count(False) / len(self.outcomes), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the statistics as JSON serializable data."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "error_rate": self.error_rate,
+            "suppressed_values": self.suppressed_values,
+            "duration": self.duration.as_dict(),
+            "last_poll": {
+                "tags": self.tags,
+                "changed": self.changed,
+                "requests": self.requests,
+                "bytes_received": self.bytes_received,
+                "invalid_values": self.invalid_values,
+            },
+        }
 
 
 class OrcaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, OrcaTagValue]]):
     """Class to manage fetching Orca data."""
 
-    def __init__(self, hass: HomeAssistant, orca_api: OrcaApi) -> None:
+    def __init__(
+        self, hass: HomeAssistant, orca_api: OrcaApi, store: Store[dict[str, Any]]
+    ) -> None:
         """Initialize."""
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            # polls are started by the shared PollScheduler, staggered with
+            # the other heat pumps
+            update_interval=None,
         )
         self.api = orca_api
         self.data: dict[str, OrcaTagValue]
+        # tag -> monotonic time at which the tag is due to be read again
+        self._next_poll: dict[str, float] = {}
+        # unique_id -> monotonic time the value of a deadband tag was last published
+        self._published_at: dict[str, float] = {}
+        self._store = store
+        # set when re-probing restored circuits failed, retried after the next poll
+        self._revalidate_pending = False
+        # monotonic time of the last snapshot write, setup writes the first one
+        self._last_saved = time.monotonic()
 
-    async def _async_update_data(self) -> dict[str, OrcaTagValue]:
-        """Fetch data from API endpoint."""
+        # unique_id -> callbacks of entities depending on it (their listener context)
+        self._listeners_by_id: defaultdict[str, set[CALLBACK_TYPE]] = defaultdict(set)
+        # ids changed by the last update, None notifies every listener
+        self._changed_ids: set[str] | None = None
+        self.listener_updates_emitted = 0
+        self.listener_updates_suppressed = 0
+        self.poll_stats = PollStats()
+        self.history = TagHistory(int(HISTORY_RETENTION / UPDATE_INTERVAL))
+        self._derived: DerivedMetrics | None = None
+        # entities of the entry, planned from the first snapshot on setup
+        self.entity_plan = EntityPlan()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the unique IDs in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not context:
+            return remove_listener
+
+        for unique_id in context:
+            self._listeners_by_id[unique_id].add(update_callback)
+
+        @callback
+        def remove_indexed_listener() -> None:
+            remove_listener()
+            for unique_id in context:
+                self._listeners_by_id[unique_id].discard(update_callback)
+
+        return remove_indexed_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only listeners whose unique IDs changed in the last update.
+
+        Listeners without a context, and every listener after a failed update or
+        an update without change tracking, are always notified.
+        """
+        changed, self._changed_ids = self._changed_ids, None
+        if changed is None:
+            self.listener_updates_emitted += len(self._listeners)
+            super().async_update_listeners()
+            return
+
+        to_notify = {
+            update_callback
+            for update_callback, context in self._listeners.values()
+            if not context
+        }
+        for unique_id in changed:
+            to_notify.update(self._listeners_by_id.get(unique_id, ()))
+
+        self.listener_updates_emitted += len(to_notify)
+        self.listener_updates_suppressed += len(self._listeners) - len(to_notify)
+        for update_callback in to_notify:
+            update_callback()
+
+    async def async_restore(self) -> bool:
+        """Restore circuit layout and last snapshot from the store.
+
+        Values are marked as restored until the device is read. Returns False
+        if nothing usable is stored and the device has to be probed first.
+        """
+        if not (stored := await self._store.async_load()):
+            return False
+        try:
+            self.api.restore_layout(stored["layout"])
+        except (KeyError, ValueError) as err:
+            LOGGER.warning("Ignoring stored Orca layout: %s", err)
+            return False
+        await self.api.load_derived_metrics()
+
+        config_by_ids = {config.unique_id: config for config in self.api.tag_configs}
+        self.data = {
+            uid: OrcaTagValue(config.tag, value, config, restored=True)
+            for uid, value in stored.get("snapshot", {}).items()
+            if (config := config_by_ids.get(uid)) is not None
+        }
+        LOGGER.debug("Restored %d values from last snapshot", len(self.data))
+        return True
+
+    async def async_revalidate(self) -> None:
+        """Refresh restored values and re-probe circuits in the background.
+
+        Reloads the entry only if the device layout differs from the stored one,
+        so entities are added or removed only when something actually changed.
+        If probing fails, it is retried after the next successful poll.
+        """
+        await self.async_refresh()
+        await self._async_revalidate_layout()
+
+    async def _async_revalidate_layout(self) -> None:
+        try:
+            available_circuits, configs = await self.api.discover()
+        except Exception as err:
+            LOGGER.warning(
+                "Could not revalidate heat pump circuits, retrying after the next poll: %s",
+                err,
+            )
+            self._revalidate_pending = True
+            return
+
+        if (
+            available_circuits != self.api.available_circuits
+            or configs != self.api.tag_configs
+        ):
+            LOGGER.info("Heat pump circuit layout changed, reloading")
+            # store the new layout first so the reload restores it
+            self.api.set_layout(available_circuits, configs)
+            await self.async_save()
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    async def async_save(self, data: dict[str, OrcaTagValue] | None = None) -> None:
+        """Writes layout and the last good values of data (default: current)."""
+        self._last_saved = time.monotonic()
+        await self._store.async_save(
+            self._data_to_store(self.data if data is None else data)
+        )
+
+    def _data_to_store(self, data: dict[str, OrcaTagValue] | None) -> dict[str, Any]:
+        """Returns layout and last good values for the store."""
+        return {
+            "layout": self.api.export_layout(),
+            "snapshot": {
+                uid: tag_value.value
+                for uid, tag_value in (data or {}).items()
+                if not tag_value.restored
+            },
+        }
+
+    @property
+    def derived(self) -> DerivedMetrics:
+        """Derived metrics of config.yml whose inputs exist on this heat pump."""
+        if self._derived is None:
+            self._derived = DerivedMetrics(
+                self.api.derived_metrics,
+                (config.unique_id for config in self.api.tag_configs),
+            )
+        return self._derived
+
+    def mark_due(self, *unique_ids: str) -> None:
+        """Read given entities on the next refresh regardless of their poll tier."""
+        for unique_id in unique_ids:
+            if tag_value := (self.data or {}).get(unique_id):
+                self._next_poll.pop(tag_value.tag, None)
+
+    async def async_set_values(
+        self, values: dict[str, Any], confirm: Iterable[str] = ()
+    ) -> None:
+        """Write values by unique ID with optimistic state and targeted read-back.
+
+        Written values are applied to the snapshot and pushed to entities right
+        away. After the write, only the written tags and the dependent tags in
+        "confirm" are read back; the device state wins if it disagrees. Invalid
+        values are rejected before any state is applied, a failed write rolls
+        the optimistic values back. While the heat pump is unreachable, writes
+        fail right away. Invalid values raise ServiceValidationError, write
+        failures HomeAssistantError.
+        """
         try:
-            # fetch_all returns a list of OrcaTagValue
-            data_list = await self.api.fetch_all()
+            self.api.circuit_breaker.raise_if_open()
+        except DeviceUnavailableError as err:
+            raise HomeAssistantError(str(err)) from err
+        try:
+            # out of range or wrongly typed values must not reach entities
+            self.api.validate_values_by_id(values)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+
+        previous = {uid: self.data.get(uid) for uid in values}
+        self._apply(
+            {
+                uid: tag_value._replace(value=value)
+                for uid, value in values.items()
+                if (tag_value := previous[uid]) is not None
+            }
+        )
 
-            # Convert list to dict keyed by unique_id (from orca_api)
-            return {item.config.unique_id: item for item in data_list}
+        try:
+            await self.api.set_values_by_id(values)
+        except Exception as err:
+            self._apply({uid: tag_value for uid, tag_value in previous.items() if tag_value})
+            # the breaker may have opened since the check above
+            if isinstance(err, (ConnectionError, TimeoutError)):
+                raise HomeAssistantError(
+                    f"Could not write to the heat pump: {err}"
+                ) from err
+            raise
 
+        read_back = [*values, *(uid for uid in confirm if uid not in values)]
+        try:
+            # ahead of queued poll batches, behind other writes
+            with request_priority(RequestPriority.CONFIRM):
+                confirmed = await self.api.fetch_by_ids(read_back)
+        except Exception as err:
+            LOGGER.warning("Could not confirm written values, will re-read: %s", err)
+            self.mark_due(*read_back)
+            return
+
+        for uid, value in values.items():
+            if uid in confirmed and confirmed[uid].value != value:
+                LOGGER.debug(
+                    "Device reports %s=%s after writing %s", uid, confirmed[uid].value, value
+                )
+        self._apply(confirmed)
+
+    def _apply(self, values: dict[str, OrcaTagValue]) -> None:
+        """Merges values into the snapshot and notifies entities."""
+        if not values:
+            return
+        self.data = {**self.data, **values}
+        self._changed_ids = set(values)
+        self.async_update_listeners()
+
+    def _due_configs(self, now: float) -> list[OrcaTagConfig]:
+        """Returns configs of tags whose poll tier interval has elapsed."""
+        return [
+            config
+            for config in self.api.tag_configs
+            if self._next_poll.get(config.tag, now) <= now
+        ]
+
+    async def _async_update_data(self) -> dict[str, OrcaTagValue]:
+        """Fetch due tags and merge them into the previous snapshot."""
+        now = time.monotonic()
+        timestamp = time.time()
+        due = self._due_configs(now)
+        api_stats = self.api.stats
+        start = time.perf_counter()
+        requests, received = api_stats.requests, api_stats.bytes_received
+        invalid = api_stats.invalid_values + api_stats.conversion_errors
+        try:
+            values = await self.api.fetch_by_tags([config.tag for config in due])
         except Exception as err:
+            self._changed_ids = None
+            self._record_poll(False, start)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        # keyed by unique_id (from orca_api)
+        data = dict(self.data) if self.data else {}
+        changed: set[str] = set()
+        # values read in this poll, before deadbands, for derived metrics
+        polled: dict[str, Any] = {}
+        # half an interval of slack so timer jitter does not skip a whole cycle
+        slack = UPDATE_INTERVAL.total_seconds() / 2
+        for config in due:
+            previous = data.get(config.unique_id)
+            if (tag_value := values.get(config.tag)) is not None:
+                polled[config.unique_id] = tag_value.value
+                if getattr(config, "history", False):
+                    self.history.add(config.unique_id, timestamp, tag_value.value)
+                if getattr(config, "deadband", 0) and self._within_deadband(
+                    config, previous, tag_value, now
+                ):
+                    self.poll_stats.suppressed_values += 1
+                elif (
+                    previous is None
+                    or previous.restored
+                    or previous.value != tag_value.value
+                ):
+                    data[config.unique_id] = tag_value
+                    changed.add(config.unique_id)
+                    self._published_at[config.unique_id] = now
+            elif previous is not None:
+                # invalid (-9999) or unconvertible, entity becomes unavailable
+                del data[config.unique_id]
+                changed.add(config.unique_id)
+
+            interval = POLL_TIER_INTERVALS[config.poll_tier]
+            self._next_poll[config.tag] = (
+                now + interval.total_seconds() - slack if interval is not None else math.inf
+            )
+
+        changed |= self.derived.update(polled, timestamp)
+
+        # after a failed update every entity has to become available again
+        self._changed_ids = changed if self.last_update_success else None
+
+        poll = self.poll_stats
+        poll.tags = len(due)
+        poll.changed = len(changed)
+        poll.requests = api_stats.requests - requests
+        poll.bytes_received = api_stats.bytes_received - received
+        poll.invalid_values = (
+            api_stats.invalid_values + api_stats.conversion_errors - invalid
+        )
+        self._record_poll(True, start)
+        self._async_import_statistics(timestamp)
+
+        LOGGER.debug(
+            "Polled %d of %d tags, %d changed", len(due), len(self.api.tag_configs), len(changed)
+        )
+        if self._revalidate_pending:
+            self._revalidate_pending = False
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_revalidate_layout(), "orca_revalidate"
+            )
+        # a delayed save would be re-armed by every poll and never run
+        if now - self._last_saved >= SNAPSHOT_SAVE_INTERVAL:
+            await self.async_save(data)
+        return data
+
+    def _within_deadband(
+        self,
+        config: OrcaTagConfig,
+        previous: OrcaTagValue | None,
+        tag_value: OrcaTagValue,
+        now: float,
+    ) -> bool:
+        """Whether a changed value stays within the deadband of the published one."""
+        if previous is None or previous.restored or previous.value == tag_value.value:
+            return False
+        # values have one decimal, ignore float noise at the boundary
+        if abs(tag_value.value - previous.value) > config.deadband + 1e-9:
+            return False
+        if (published_at := self._published_at.get(config.unique_id)) is None:
+            return False
+        return not (
+            config.min_report_interval
+            and now - published_at >= config.min_report_interval
+        )
+
+    def _record_poll(self, success: bool, start: float) -> None:
+        poll = self.poll_stats
+        poll.polls += 1
+        poll.failed_polls += not success
+        poll.outcomes.append(success)
+        poll.duration.add(time.perf_counter() - start)
+
+    @callback
+    def _async_import_statistics(self, timestamp: float) -> None:
+        """Imports hourly mean/min/max of tags with history as external statistics.
+
+        They are kept separate from the entities' own statistics, so the sensor
+        of such a tag can be disabled without losing its history.
+        """
+        completed = self.history.completed_hours(timestamp)
+        if not completed or "recorder" not in self.hass.config.components:
+            return
+
+        config_by_ids = {config.unique_id: config for config in self.api.tag_configs}
+        lang_si = self.config_entry.data.get(CONF_LANGUAGE) == LANG_SI
+        for unique_id, hours in completed.items():
+            if (config := config_by_ids.get(unique_id)) is None:
+                continue
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=config.name.si if lang_si else config.name.en,
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{self.config_entry.entry_id}_{unique_id}".lower(),
+                unit_of_measurement=config.unit,
+            )
+            statistics = [
+                StatisticData(
+                    start=datetime.fromtimestamp(hour.start, UTC),
+                    mean=hour.mean,
+                    min=hour.min,
+                    max=hour.max,
+                )
+                for hour in hours
+            ]
+            async_add_external_statistics(self.hass, metadata, statistics)
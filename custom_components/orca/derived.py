@@ -0,0 +1,225 @@
+"""Derived metrics computed from polled values, declared in config.yml.
+
+Formulas are arithmetic expressions over unique IDs, e.g.
+"hc_outlet_temp_1 - hc_desired_outlet_temp_1". Comparisons yield 1 or 0 and
+booleans count as 1 or 0. Available functions:
+
+- abs(x), min(a, b, ...), max(a, b, ...)
+- prev(id): value of id at the previous poll
+- rate(id): change of id per minute since the previous poll
+- mean(x, n): moving average of x over the last n polls
+
+Formulas are compiled once into nested closures. Per poll, formulas without
+prev/rate/mean are only evaluated if one of their inputs changed.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections import deque
+from collections.abc import Callable, Iterable
+import logging
+import operator
+from typing import Any
+
+from .models import DerivedMetric
+
+_LOGGER = logging.getLogger(__name__)
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_COMPARE_OPERATORS = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+_AGGREGATES = {"abs": abs, "min": min, "max": max}
+
+
+class _Inputs:
+    """Values seen by formulas during one evaluation."""
+
+    __slots__ = ("current", "previous", "minutes")
+
+    def __init__(self) -> None:
+        self.current: dict[str, Any] = {}
+        self.previous: dict[str, Any] = {}
+        # since the previous poll
+        self.minutes = 0.0
+
+
+# evaluates a (sub)expression, raises KeyError/TypeError/ZeroDivisionError when undefined
+Evaluator = Callable[[_Inputs], float]
+
+
+class Formula:
+    """A compiled formula with the unique IDs it reads."""
+
+    def __init__(self, source: str) -> None:
+        """Compile source, raises ValueError if it is not a valid formula."""
+        self.source = source
+        self.names: set[str] = set()
+        # uses values of earlier polls, has to be evaluated every poll
+        self.stateful = False
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as err:
+            raise ValueError(f"Invalid formula {source!r}: {err.msg}") from err
+        self._evaluate = self._compile(tree.body)
+
+    def evaluate(self, inputs: _Inputs) -> float | None:
+        try:
+            return float(self._evaluate(inputs))
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            return None
+
+    def _compile(self, node: ast.expr) -> Evaluator:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            value = node.value
+            return lambda inputs: value
+        if isinstance(node, ast.Name):
+            return self._name(node.id, lambda inputs: inputs.current)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            operand = self._compile(node.operand)
+            return lambda inputs: -operand(inputs)
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            op = _BINARY_OPERATORS[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda inputs: op(left(inputs), right(inputs))
+        if (
+            isinstance(node, ast.Compare)
+            and len(node.ops) == 1
+            and type(node.ops[0]) in _COMPARE_OPERATORS
+        ):
+            op = _COMPARE_OPERATORS[type(node.ops[0])]
+            left, right = self._compile(node.left), self._compile(node.comparators[0])
+            return lambda inputs: 1.0 if op(left(inputs), right(inputs)) else 0.0
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            return self._call(node.func.id, node.args)
+        raise ValueError(f"Unsupported expression in formula {self.source!r}")
+
+    def _name(
+        self, name: str, source: Callable[[_Inputs], dict[str, Any]]
+    ) -> Evaluator:
+        self.names.add(name)
+
+        def value(inputs: _Inputs) -> float:
+            # booleans are numbers already, multimode strings raise TypeError later
+            return source(inputs)[name]
+
+        return value
+
+    def _call(self, function: str, args: list[ast.expr]) -> Evaluator:
+        if function in _AGGREGATES and args:
+            aggregate = _AGGREGATES[function]
+            compiled = [self._compile(arg) for arg in args]
+            if len(compiled) == 1:
+                single = compiled[0]
+                return lambda inputs: aggregate(single(inputs))
+            return lambda inputs: aggregate(arg(inputs) for arg in compiled)
+
+        if function in ("prev", "rate") and len(args) == 1 and isinstance(args[0], ast.Name):
+            self.stateful = True
+            current = self._name(args[0].id, lambda inputs: inputs.current)
+            previous = self._name(args[0].id, lambda inputs: inputs.previous)
+            if function == "prev":
+                return previous
+            return lambda inputs: (current(inputs) - previous(inputs)) / inputs.minutes
+
+        if (
+            function == "mean"
+            and len(args) == 2
+            and isinstance(args[1], ast.Constant)
+            and isinstance(args[1].value, int)
+            and args[1].value > 0
+        ):
+            self.stateful = True
+            return _moving_average(self._compile(args[0]), args[1].value)
+
+        raise ValueError(f"Unsupported function {function}() in formula {self.source!r}")
+
+
+def _moving_average(expression: Evaluator, size: int) -> Evaluator:
+    """Mean of the last size defined values of expression, updated in O(1)."""
+    window: deque[float] = deque(maxlen=size)
+    total = 0.0
+
+    def mean(inputs: _Inputs) -> float:
+        nonlocal total
+        try:
+            value = float(expression(inputs))
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            value = None
+        if value is not None:
+            if len(window) == size:
+                total -= window[0]
+            window.append(value)
+            total += value
+        if not window:
+            raise KeyError("no values yet")
+        return total / len(window)
+
+    return mean
+
+
+class DerivedMetrics:
+    """Evaluates derived metrics once per poll over the polled values.
+
+    Metrics reading unique IDs that are not in the layout (e.g. of a circuit
+    the heat pump does not have) are left out.
+    """
+
+    def __init__(
+        self, metrics: Iterable[DerivedMetric], available_ids: Iterable[str]
+    ) -> None:
+        available = set(available_ids)
+        self.metrics: dict[str, DerivedMetric] = {}
+        self._formulas: dict[str, Formula] = {}
+        for metric in metrics:
+            try:
+                formula = Formula(metric.formula)
+            except ValueError as err:
+                _LOGGER.error("Skipping derived metric %s: %s", metric.derived, err)
+                continue
+            if formula.names <= available:
+                self.metrics[metric.derived] = metric
+                self._formulas[metric.derived] = formula
+        self.values: dict[str, float | None] = {}
+        self._inputs = _Inputs()
+        self._last_update: float | None = None
+
+    def update(self, polled: dict[str, Any], timestamp: float) -> set[str]:
+        """Evaluates metrics with the values read in a poll, returns changed IDs."""
+        inputs = self._inputs
+        changed = {
+            uid for uid, value in polled.items() if inputs.current.get(uid, ...) != value
+        }
+        inputs.previous = dict(inputs.current)
+        inputs.current.update(polled)
+        elapsed = 0.0 if self._last_update is None else timestamp - self._last_update
+        self._last_update = timestamp
+        # rate() is undefined without an earlier poll
+        inputs.minutes = elapsed / 60
+
+        updated = set()
+        for metric_id, formula in self._formulas.items():
+            if (
+                not formula.stateful
+                and metric_id in self.values
+                and not formula.names & changed
+            ):
+                continue
+            value = formula.evaluate(inputs)
+            if value is not None:
+                value = round(value, 2)
+            if self.values.get(metric_id, ...) != value:
+                self.values[metric_id] = value
+                updated.add(metric_id)
+        return updated
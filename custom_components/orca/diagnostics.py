@@ -0,0 +1,49 @@
+"""Diagnostics support for the Orca integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, DATA_SCHEDULER, DOMAIN
+from .coordinator import OrcaDataUpdateCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "layout": {
+            "available_circuits": api.available_circuits,
+            "tags": len(api.tag_configs),
+            "platforms": coordinator.entity_plan.platforms,
+        },
+        "last_update_success": coordinator.last_update_success,
+        "polls": coordinator.poll_stats.as_dict(),
+        "api": api.stats.as_dict(),
+        "request_plan": api.request_planner.as_dict(),
+        "request_queue": api.request_scheduler.as_dict(),
+        "circuit_breaker": api.circuit_breaker.as_dict(),
+        "request_timeout": api.request_timeout,
+        # load of all heat pumps polled by this Home Assistant
+        "scheduler": hass.data[DATA_SCHEDULER].as_dict(),
+        "listeners": {
+            "updates_emitted": coordinator.listener_updates_emitted,
+            "updates_suppressed": coordinator.listener_updates_suppressed,
+        },
+        "derived": coordinator.derived.values,
+        "values": {
+            unique_id: tag_value.value
+            for unique_id, tag_value in (coordinator.data or {}).items()
+        },
+    }
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.const import EntityCategory
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -11,6 +13,16 @@ from .coordinator import OrcaDataUpdateCoordinator
 from .orca_api import OrcaTagValue
 
 
+def orca_device_info(coordinator: OrcaDataUpdateCoordinator) -> DeviceInfo:
+    """Return the device all entities of a config entry belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        name="Orca Heat Pump",
+        manufacturer="Orca",
+        model="Heat Pump",
+    )
+
+
 class OrcaEntity(CoordinatorEntity[OrcaDataUpdateCoordinator]):
     """Defines a base Orca entity."""
 
@@ -19,9 +31,14 @@ class OrcaEntity(CoordinatorEntity[OrcaDataUpdateCoordinator]):
         coordinator: OrcaDataUpdateCoordinator,
         unique_id_: str,  # as defined in config.yml
         entity_description=None,
+        tracked_ids: Iterable[str] = (),
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity.
+
+        The entity state is only rewritten when unique_id_ or one of the
+        tracked_ids changes in coordinator data.
+        """
+        super().__init__(coordinator, context=frozenset({unique_id_, *tracked_ids}))
         self.unique_id_ = unique_id_
         if entity_description:
             self.entity_description = entity_description
@@ -59,18 +76,21 @@ class OrcaEntity(CoordinatorEntity[OrcaDataUpdateCoordinator]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name="Orca Heat Pump",
-            manufacturer="Orca",
-            model="Heat Pump",
-        )
+        return orca_device_info(self.coordinator)
 
     @property
     def tag_data(self) -> OrcaTagValue:
         """Return the current data for this specific tag."""
         return self.coordinator.data[self.unique_id_]
 
+    @property
+    def extra_state_attributes(self) -> dict[str, bool] | None:
+        """Flag values restored from the last snapshot until the device is read."""
+        tag_data = self.coordinator.data.get(self.unique_id_)
+        if tag_data is not None and tag_data.restored:
+            return {"restored": True}
+        return None
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -0,0 +1,132 @@
+"""Entities of a config entry, planned once per setup.
+
+The plan is built from the first snapshot (read or restored) and the available
+circuits. Platforms look up their unique IDs in it instead of filtering every
+tag again, and only platforms with entities are set up. The unique IDs read by
+composite entities (climate) are precomputed per circuit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .const import EXCLUDED_IDS
+from .models import OrcaTagConfig
+
+# circuits 1 and 2 are used for room heating, usually floor and/or radiators
+CLIMATE_CIRCUITS = (1, 2)
+# circuit 4 is the water heater as defined in config.yml
+WATER_HEATER_CIRCUIT = 4
+WATER_HEATER_ID = "wh_temp_top"
+# config.yml IDs of ClimateKeys fields after circuit_id, in field order
+CLIMATE_IDS = (
+    "hc_room_temp",
+    "hc_desired_day_temp",
+    "hc_desired_night_temp",
+    "hc_desired_room_temp",
+    "hc_turned_on",
+    "hc_mode",
+    "hc_pump_status",
+    "timer_programme",
+    "hc_name",
+)
+
+
+class ClimateKeys(NamedTuple):
+    """Unique IDs read and written by the climate entity of a heating circuit."""
+
+    circuit_id: int
+    room_temp: str
+    desired_day_temp: str
+    desired_night_temp: str
+    desired_room_temp: str
+    turned_on: str
+    mode: str
+    pump_status: str
+    timer_programme: str
+    name: str
+
+    @classmethod
+    def for_circuit(cls, circuit_id: int) -> ClimateKeys:
+        """Returns the unique IDs of circuit_id, e.g. "hc_mode_1"."""
+        return cls(
+            circuit_id,
+            *(f"{id_}_{circuit_id}" for id_ in CLIMATE_IDS),
+        )
+
+    @property
+    def tracked(self) -> tuple[str, ...]:
+        """IDs whose changes rewrite the state, besides room_temp."""
+        return (
+            self.desired_day_temp,
+            self.desired_night_temp,
+            self.turned_on,
+            self.mode,
+            self.pump_status,
+            self.timer_programme,
+        )
+
+
+@dataclass(frozen=True)
+class EntityPlan:
+    """Unique IDs per platform, or keys of composite entities."""
+
+    binary_sensors: tuple[str, ...] = ()
+    switches: tuple[str, ...] = ()
+    numbers: tuple[str, ...] = ()
+    sensors: tuple[str, ...] = ()
+    climates: tuple[ClimateKeys, ...] = ()
+    water_heaters: tuple[str, ...] = ()
+
+    @property
+    def platforms(self) -> list[str]:
+        """Names of the platforms with at least one entity.
+
+        The sensor platform is always set up, it holds the diagnostic sensors.
+        """
+        entities = {
+            "binary_sensor": self.binary_sensors,
+            "climate": self.climates,
+            "number": self.numbers,
+            "sensor": True,
+            "switch": self.switches,
+            "water_heater": self.water_heaters,
+        }
+        return [platform for platform, planned in entities.items() if planned]
+
+
+def plan_entities(
+    configs: Iterable[OrcaTagConfig], available_circuits: Iterable[int]
+) -> EntityPlan:
+    """Assigns tags to platforms by type and adjustability in one pass.
+
+    configs are those of the tags with values, tags excluded by EXCLUDED_IDS
+    are handled by the climate and water heater entities.
+    """
+    binary_sensors, switches, numbers, sensors = [], [], [], []
+    for config in configs:
+        if config.id in EXCLUDED_IDS:
+            continue
+        adjustable = config.adjustable.enabled
+        if config.type == "boolean":
+            (switches if adjustable else binary_sensors).append(config.unique_id)
+        elif config.type == "float":
+            (numbers if adjustable else sensors).append(config.unique_id)
+        elif not adjustable:
+            sensors.append(config.unique_id)
+
+    circuits = set(available_circuits)
+    return EntityPlan(
+        binary_sensors=tuple(binary_sensors),
+        switches=tuple(switches),
+        numbers=tuple(numbers),
+        sensors=tuple(sensors),
+        climates=tuple(
+            ClimateKeys.for_circuit(circuit_id)
+            for circuit_id in CLIMATE_CIRCUITS
+            if circuit_id in circuits
+        ),
+        water_heaters=(WATER_HEATER_ID,) if WATER_HEATER_CIRCUIT in circuits else (),
+    )
@@ -0,0 +1,99 @@
+"""Fixed-size in-memory history of numeric tags, aggregated per hour."""
+
+from __future__ import annotations
+
+from array import array
+from typing import NamedTuple
+
+HOUR = 3600
+
+
+class PeriodStats(NamedTuple):
+    """Mean, minimum and maximum of the samples of one period."""
+
+    start: float
+    mean: float
+    min: float
+    max: float
+    samples: int
+
+
+class RingBuffer:
+    """Timestamped samples in preallocated arrays, the oldest are overwritten."""
+
+    def __init__(self, capacity: int) -> None:
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, timestamp: float, value: float) -> None:
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def period(self, start: float, end: float) -> PeriodStats | None:
+        """Aggregates samples with start <= timestamp < end, None if there are none."""
+        total = 0.0
+        count = 0
+        low = high = 0.0
+        first = (self._next - self._size) % self._capacity
+        for i in range(self._size):
+            index = (first + i) % self._capacity
+            if start <= self._times[index] < end:
+                value = self._values[index]
+                if count == 0 or value < low:
+                    low = value
+                if count == 0 or value > high:
+                    high = value
+                total += value
+                count += 1
+        if count == 0:
+            return None
+        return PeriodStats(start, total / count, low, high, count)
+
+
+class TagHistory:
+    """Ring buffers of numeric tags and the hours already handed out.
+
+    Capacity is the number of samples kept per tag, retention divided by the
+    poll interval. It has to cover more than an hour, hours are aggregated
+    once they are complete.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._buffers: dict[str, RingBuffer] = {}
+        # start of the first hour that was not aggregated yet, per unique_id
+        self._pending_hour: dict[str, float] = {}
+
+    def add(self, unique_id: str, timestamp: float, value: float) -> None:
+        if (buffer := self._buffers.get(unique_id)) is None:
+            buffer = self._buffers[unique_id] = RingBuffer(self._capacity)
+            self._pending_hour[unique_id] = timestamp - timestamp % HOUR
+        buffer.add(timestamp, value)
+
+    def completed_hours(self, now: float) -> dict[str, list[PeriodStats]]:
+        """Returns statistics of hours completed since the last call, per unique_id."""
+        current_hour = now - now % HOUR
+        completed = {}
+        for unique_id, buffer in self._buffers.items():
+            hours = []
+            hour = self._pending_hour[unique_id]
+            while hour < current_hour:
+                if (stats := buffer.period(hour, hour + HOUR)) is not None:
+                    hours.append(stats)
+                hour += HOUR
+            self._pending_hour[unique_id] = hour
+            if hours:
+                completed[unique_id] = hours
+        return completed
+
+    def as_dict(self) -> dict[str, int]:
+        """Returns the number of samples kept per unique_id."""
+        return {unique_id: len(buffer) for unique_id, buffer in self._buffers.items()}
@@ -33,6 +33,10 @@ class AdjustableSettings(BaseModel):
     range: NumericRange = Field(default_factory=NumericRange)
 
 
+# How often a tag is read, see POLL_TIER_INTERVALS in const.py
+PollTier = Literal["fast", "normal", "slow", "static"]
+
+
 class BaseSensor(BaseModel):
     """Parent class containing common fields for all sensor types."""
 
@@ -43,6 +47,7 @@ class BaseSensor(BaseModel):
     description: str = ""  # Default empty string if missing
     heating_circuit: int
     adjustable: AdjustableSettings = Field(default_factory=AdjustableSettings)
+    poll_tier: PollTier = "fast"
 
 
 class FloatSensor(BaseSensor):
@@ -50,6 +55,12 @@ class FloatSensor(BaseSensor):
 
     type: Literal["float"]
     unit: str
+    # kept in memory and imported as hourly long-term statistics, see history.py
+    history: bool = False
+    # a new value is published only if it moves by more than deadband or, when
+    # set, min_report_interval seconds passed since the last published value
+    deadband: float = 0.0
+    min_report_interval: int = 0
 
 
 class BooleanSensor(BaseSensor):
@@ -66,6 +77,16 @@ class MultimodeSensor(BaseSensor):
     value_map: dict[int, str] = Field(default_factory=dict)
 
 
+class DerivedMetric(BaseModel):
+    """Model for config.yml items computed from other values, see derived.py."""
+
+    derived: str  # unique ID of the result
+    name: LocalizedName
+    description: str = ""
+    formula: str
+    unit: str = ""
+
+
 # Union type that uses the 'type' field to determine which model to validate against
 OrcaTagConfig = Annotated[
     Union[FloatSensor, MultimodeSensor, BooleanSensor], Field(discriminator="type")
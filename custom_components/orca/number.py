@@ -7,7 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, EXCLUDED_IDS
+from .const import DOMAIN
 from .coordinator import OrcaDataUpdateCoordinator
 from .entity import OrcaEntity
 
@@ -20,16 +20,10 @@ async def async_setup_entry(
     """Set up Orca numbers."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for unique_id, tag_value in coordinator.data.items():
-        if (
-            tag_value.config.type == "float"
-            and tag_value.config.adjustable.enabled
-            and tag_value.config.id not in EXCLUDED_IDS
-        ):
-            entities.append(OrcaNumber(coordinator, unique_id))
-
-    async_add_entities(entities)
+    async_add_entities(
+        OrcaNumber(coordinator, unique_id)
+        for unique_id in coordinator.entity_plan.numbers
+    )
 
 
 class OrcaNumber(OrcaEntity, NumberEntity):
@@ -55,5 +49,4 @@ class OrcaNumber(OrcaEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        await self.coordinator.api.set_value_by_id(self.unique_id_, value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({self.unique_id_: value})
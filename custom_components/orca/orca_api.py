@@ -1,18 +1,32 @@
 """Orca Heat Pump API client."""
 
 import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum, StrEnum
+import hashlib
+import heapq
+import json
 import logging
 from pathlib import Path
+import random
 import re
-from typing import Any, Union
+import time
+from typing import Any, Callable, NamedTuple, Union
 
 import aiofiles
+import aiofiles.os
 import aiohttp
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, TypeAdapter, ValidationError
 import yaml
+from yarl import URL
 
 from .models import (
     BooleanSensor,
+    DerivedMetric,
     FloatSensor,
     LocalizedName,
     MultimodeSensor,
@@ -21,21 +35,537 @@ from .models import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Name of the cookie holding the session token issued by /cgi/login
+TOKEN_COOKIE = "IDALToken"
+# The embedded web server handles only a few parallel connections
+MAX_CONNECTIONS_PER_HOST = 2
+KEEPALIVE_TIMEOUT = 30
+# Requests time out after TIMEOUT_LATENCY_FACTOR times the 95th percentile of
+# recent request latencies, within MIN_..MAX_REQUEST_TIMEOUT. MAX applies until
+# TIMEOUT_MIN_SAMPLES requests were measured and while the device is failing.
+# After a timeout MAX applies again until TIMEOUT_MIN_SAMPLES requests succeeded,
+# so latencies of a device that got slower can raise the percentile.
+MIN_REQUEST_TIMEOUT = 2.0
+MAX_REQUEST_TIMEOUT = 10.0
+TIMEOUT_LATENCY_FACTOR = 4
+TIMEOUT_MIN_SAMPLES = 10
+# an offline device does not answer the TCP handshake at all
+CONNECT_TIMEOUT = 3.0
+# After BREAKER_FAILURE_THRESHOLD failed requests in a row requests fail at once;
+# the device is probed again after BREAKER_BASE_DELAY, doubling up to
+# BREAKER_MAX_DELAY while the probes keep failing
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_DELAY = 30.0
+BREAKER_MAX_DELAY = 300.0
+# /cgi/login answers #E_TOO_MANY_USERS while all user slots of the device are taken
+LOGIN_MAX_ATTEMPTS = 6
+LOGIN_BACKOFF_BASE = 2.0
+LOGIN_BACKOFF_MAX = 60.0
+# not confirmed on the firmware, only sent on close() as a best effort
+LOGOUT_PATH = "/cgi/logout"
+# Tokens older than the shortest observed lifetime are replaced before the next
+# request instead of after an E_NEED_LOGIN answer. They have expired by then, so
+# the new login does not take a second user slot. Expiries of younger tokens
+# (e.g. device reboot) do not count as lifetime.
+MIN_TOKEN_LIFETIME = 60.0
+# readTags batch sizes the planner chooses from, DEFAULT_BATCH_SIZE is tried first
+BATCH_SIZES = (60, 90, 120, 150, 200, 250)
+DEFAULT_BATCH_SIZE = 150
+# the firmware accepts 150 config.yml tags (~3,200 characters), longer request
+# lines are rejected by many embedded web servers
+MAX_URL_LENGTH = 8192
+# Raw values read within this many seconds are served from the read cache;
+# callers arriving while a read of their tags is in flight join that read
+READ_CACHE_TTL = 1.0
+# Writes issued within this many seconds are sent in one writeTags request
+WRITE_COALESCE_DELAY = 0.005
+WRITE_BATCH_SIZE = 50
+
+# One S_OK readTags entry: "#<tag>\tS_OK\n<quality>\t<value>\n", captures tag and
+# value. Fields may also be separated by ";", entries with fewer than four fields
+# or another status never match and fields past the fourth are skipped.
+_RESPONSE_ENTRY = re.compile(
+    r"(?:\A|#)([^\t\n;#]*)[\t\n;]S_OK[\t\n;][^\t\n;#]*[\t\n;]([^\t\n;#]*)"
+)
+
+
+# Bump when the layout of the compiled config cache changes
+CONFIG_CACHE_FORMAT = 2
+# libyaml based loader is several times faster when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CONFIG_ADAPTER = TypeAdapter(list[OrcaTagConfig])
+
+
+class _ConfigCache(BaseModel):
+    """Validated tag configuration as stored in the compiled config cache."""
+
+    key: str
+    configs: list[OrcaTagConfig]
+    derived: list[DerivedMetric] = []
+
+
+class SampleWindow:
+    """The most recent samples of a measurement, e.g. latencies in seconds."""
+
+    def __init__(self, size: int = 100) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, sample: float) -> None:
+        self._samples.append(sample)
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank percentile of the window, None while it is empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(0, round(percent / 100 * len(ordered)) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "samples": len(self),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": max(self._samples, default=None),
+        }
+
+
+@dataclass
+class OrcaApiStats:
+    """Counters of the client's interaction with the device.
+
+    Counters only grow, consumers compare them between two points in time.
+    """
+
+    # HTTP requests sent, including logins, and response bytes received
+    requests: int = 0
+    bytes_received: int = 0
+    # connection errors, timeouts and #E_ error responses
+    request_errors: int = 0
+    # seconds per HTTP request
+    request_latency: SampleWindow = field(default_factory=SampleWindow)
+    # successful logins, including the first one
+    logins: int = 0
+    # logins after the token expired
+    relogins: int = 0
+    # login attempts rejected with #E_TOO_MANY_USERS and retried
+    login_slot_waits: int = 0
+    # tags read as -9999 (no sensor) or with a value the codec rejected
+    invalid_values: int = 0
+    conversion_errors: int = 0
+    # tags served from the read cache, sent to the device, or taken from a read
+    # another caller had in flight
+    cache_hits: int = 0
+    cache_misses: int = 0
+    merged_reads: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the counters as JSON serializable data."""
+        return {
+            key: value.as_dict() if isinstance(value, SampleWindow) else value
+            for key, value in vars(self).items()
+        }
+
+
+class RequestPlanner:
+    """Splits tags into readTags URIs and adapts the batch size.
+
+    URIs are cached per tag set, polls of an unchanged set reuse them. The
+    planner keeps a moving average of poll time per tag for each batch size
+    and every EXPLORE_EVERY reads tries a neighbouring size, so it converges
+    on the fastest size. After a failed read the next smaller size is tried;
+    if that succeeds, the firmware did not tolerate the larger size and sizes
+    are capped below it until CAP_RESET_READS good reads later. If the smaller
+    size fails too, the device is unreachable and the size is not blamed.
+    """
+
+    EXPLORE_EVERY = 10
+    CAP_RESET_READS = 500
+    SMOOTHING = 0.2
+    MAX_CACHED_PLANS = 8
+
+    def __init__(
+        self,
+        batch_sizes: tuple[int, ...] = BATCH_SIZES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> None:
+        self._sizes = batch_sizes
+        self._index = batch_sizes.index(batch_size)
+        self._cap = len(batch_sizes) - 1
+        self._max_url_length = max_url_length
+        # batch size -> moving average of seconds per tag
+        self._cost: dict[int, float] = {}
+        self._errors: dict[int, int] = {}
+        self._reads = 0
+        self._good_reads_since_cap = 0
+        # index of a batch size whose read failed, until a smaller one is tried
+        self._suspect: int | None = None
+        self._explore_up = True
+        self._plans: dict[tuple[str, ...], list[str]] = {}
+
+    @property
+    def batch_size(self) -> int:
+        return self._sizes[self._index]
+
+    def plan(self, tags: list[str]) -> list[str]:
+        """Returns readTags URIs for tags, cached while the set is unchanged."""
+        key = tuple(tags)
+        if (uris := self._plans.get(key)) is None:
+            if len(self._plans) >= self.MAX_CACHED_PLANS:
+                self._plans.clear()
+            uris = self._plans[key] = self.build(tags, self.batch_size)
+        return uris
+
+    def build(self, tags: list[str], batch_size: int) -> list[str]:
+        """Batches tags into URIs of at most batch_size tags and MAX_URL_LENGTH."""
+        uris = []
+        params: list[str] = []
+        # URL length before the tag parameters, with room for an IP host and n
+        length = base = len("http://255.255.255.255/cgi/readTags?client=OrcaTouch1172&n=000")
+        for tag in tags:
+            param = f"&t{len(params) + 1}={tag}"
+            if params and (
+                len(params) >= batch_size or length + len(param) > self._max_url_length
+            ):
+                uris.append(self._uri(params))
+                params = []
+                length = base
+                param = f"&t1={tag}"
+            params.append(param)
+            length += len(param)
+        if params:
+            uris.append(self._uri(params))
+        return uris
+
+    @staticmethod
+    def _uri(params: list[str]) -> str:
+        return f"/cgi/readTags?client=OrcaTouch1172&n={len(params)}{''.join(params)}"
+
+    def record(self, tags: int, seconds: float) -> None:
+        """Records a successful read of tags made with the current batch size."""
+        if tags <= self._sizes[0]:
+            # fits one batch of any size, says nothing about the batch size
+            return
+        if self._suspect is not None:
+            size = self._sizes[self._suspect]
+            self._errors[size] = self._errors.get(size, 0) + 1
+            self._cost.pop(size, None)
+            self._cap = self._suspect - 1
+            self._good_reads_since_cap = 0
+            self._suspect = None
+            _LOGGER.debug("readTags failed with %d tags per batch, capping batch size", size)
+        size = self.batch_size
+        per_tag = seconds / tags
+        previous = self._cost.get(size)
+        self._cost[size] = (
+            per_tag if previous is None else previous + self.SMOOTHING * (per_tag - previous)
+        )
+        self._reads += 1
+        self._good_reads_since_cap += 1
+        if (
+            self._cap < len(self._sizes) - 1
+            and self._good_reads_since_cap >= self.CAP_RESET_READS
+        ):
+            self._cap += 1
+            self._good_reads_since_cap = 0
+        self._choose()
+
+    def record_error(self, tags: int) -> None:
+        """Records a read rejected by the firmware, maybe for its batch size."""
+        if tags <= self._sizes[0]:
+            return
+        if self._suspect is not None:
+            # the smaller size failed as well, not a batch size problem
+            self._set_index(self._suspect)
+            self._suspect = None
+        elif self._index > 0:
+            self._suspect = self._index
+            self._set_index(self._index - 1)
+
+    def _choose(self) -> None:
+        allowed = range(self._cap + 1)
+        if self._reads % self.EXPLORE_EVERY == 0:
+            # alternate between trying the next smaller and larger size
+            step = 1 if self._explore_up else -1
+            self._explore_up = not self._explore_up
+            if self._index + step in allowed:
+                self._set_index(self._index + step)
+                return
+        best = min(
+            (i for i in allowed if self._sizes[i] in self._cost),
+            key=lambda i: self._cost[self._sizes[i]],
+            default=self._index,
+        )
+        self._set_index(best)
+
+    def _set_index(self, index: int) -> None:
+        if index != self._index:
+            self._index = index
+            self._plans.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the planner state as JSON serializable data."""
+        return {
+            "batch_size": self.batch_size,
+            "max_batch_size": self._sizes[self._cap],
+            "seconds_per_tag": {size: round(cost, 6) for size, cost in self._cost.items()},
+            "errors": self._errors,
+        }
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued requests get a connection, lowest value first."""
+
+    # writes from entities and services, a user is waiting
+    WRITE = 0
+    # read-back after a write
+    CONFIRM = 1
+    # periodic coordinator polls
+    POLL = 2
+    # circuit discovery, revalidation and tag scans
+    BACKGROUND = 3
+
+
+# priority of requests made by the current task, see request_priority()
+_REQUEST_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    "orca_request_priority", default=RequestPriority.POLL
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Requests made within the block, also by tasks it starts, use priority."""
+    token = _REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+class RequestScheduler:
+    """Grants at most max_concurrent requests to the device at a time.
 
-class OrcaTagValue(BaseModel):
+    Waiting requests are served by priority and in arrival order within a
+    priority, so a write queued behind the remaining batches of a poll is
+    sent before them. Requests already sent are never interrupted.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max_concurrent
+        self._active = 0
+        # (priority, arrival, future resolved when the slot is granted)
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrivals = 0
+        # per priority: requests, seconds waited for a slot, deepest queue
+        self._requests = dict.fromkeys(RequestPriority, 0)
+        self._waits = {priority: SampleWindow() for priority in RequestPriority}
+        self._max_depth = dict.fromkeys(RequestPriority, 0)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Holds one of the concurrent request slots for the block."""
+        start = time.perf_counter()
+        if self._active < self.max_concurrent and not self._queue:
+            self._active += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._arrivals += 1
+            entry = (priority, self._arrivals, waiter)
+            heapq.heappush(self._queue, entry)
+            depth = sum(1 for queued, _, _ in self._queue if queued == priority)
+            self._max_depth[priority] = max(self._max_depth[priority], depth)
+            self._grant()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # granted just before the cancellation, pass the slot on
+                    self._release()
+                elif entry in self._queue:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                raise
+        self._requests[priority] += 1
+        self._waits[priority].add(time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        while self._queue and self._active < self.max_concurrent:
+            _, _, waiter = heapq.heappop(self._queue)
+            # skips waiters cancelled before they could leave the queue
+            if not waiter.done():
+                waiter.set_result(None)
+                self._active += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns queue state and waits per priority as JSON serializable data."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "priorities": {
+                priority.name.lower(): {
+                    "requests": self._requests[priority],
+                    "max_queue_depth": self._max_depth[priority],
+                    "wait": self._waits[priority].as_dict(),
+                }
+                for priority in RequestPriority
+            },
+        }
+
+
+class DeviceUnavailableError(ConnectionError):
+    """Raised without contacting the device while the circuit breaker is open."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    # the delay passed, one probe request is let through
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops sending requests to a heat pump that does not answer.
+
+    Closed: requests pass, failure_threshold connection errors or timeouts in
+    a row open the breaker. Open: requests fail with DeviceUnavailableError
+    until the delay passed. Half open: a single probe request is sent, success
+    closes the breaker, failure opens it again with the delay doubled. Error
+    responses of the device (#E_...) count as answers.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_delay: float = BREAKER_BASE_DELAY,
+        max_delay: float = BREAKER_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._delay = base_delay
+        self._retry_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe, 0 unless the breaker is open."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - self._clock())
+
+    def raise_if_open(self) -> None:
+        """Fails fast while no request would be let through, e.g. before a write."""
+        if (self.state is CircuitState.OPEN and self.retry_in > 0) or (
+            self.state is CircuitState.HALF_OPEN and self._probing
+        ):
+            self.rejected += 1
+            raise DeviceUnavailableError(
+                f"Heat pump is unreachable, next attempt in {self.retry_in:.0f} s"
+            )
+
+    def before_request(self) -> bool:
+        """Raises DeviceUnavailableError or lets the request through.
+
+        Returns whether the request is the probe of a half open breaker.
+        """
+        self.raise_if_open()
+        if self.state is CircuitState.OPEN:
+            self.state = CircuitState.HALF_OPEN
+        if self.state is CircuitState.HALF_OPEN:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self.state is not CircuitState.CLOSED:
+            _LOGGER.info("Heat pump is reachable again")
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._delay = self._base_delay
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state is CircuitState.HALF_OPEN:
+            self._delay = min(self._delay * 2, self._max_delay)
+            self._open()
+        elif self.state is CircuitState.CLOSED and self._failures >= self._threshold:
+            _LOGGER.warning(
+                "Heat pump did not answer %d requests, pausing requests for %.0f s",
+                self._failures,
+                self._delay,
+            )
+            self._open()
+
+    def record_abandoned(self) -> None:
+        """The probe was cancelled before it had a result, the next one may go."""
+        self._probing = False
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._retry_at = self._clock() + self._delay
+        self._probing = False
+        self.opened += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the breaker state as JSON serializable data."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "retry_in": round(self.retry_in, 1),
+            "delay": self._delay,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class OrcaTagValue(NamedTuple):
     """Represents a runtime value retrieved from the Heat Pump.
 
-    Replaces the previous dataclass.
+    A plain record without validation, one is built per tag on every poll.
     """
 
     tag: str
     value: Union[float, int, bool, str, None]
     config: OrcaTagConfig
+    # value comes from the last stored snapshot, not from the device
+    restored: bool = False
 
     def __repr__(self):
         return f"Tag: {self.tag} | Value: {self.value} | ID: {self.config.id}"
 
 
+class TagCodec(NamedTuple):
+    """Converters between API strings and Python values for one tag."""
+
+    # raw API string -> typed value, None if it does not fit the configured type
+    decode: Callable[[str], Any]
+    # Python value -> API string, raises ValueError if invalid
+    encode: Callable[[Any], str]
+
+
 # translates english circuit names to slovenian
 CIRCUIT_NAME_MAP_SI = {
     "Heating Circuit 1": "ogrevalni krog 1",
@@ -61,18 +591,66 @@ CIRCUIT_NAME_MAP_SI = {
 class OrcaApi:
     """Client for interacting with the Orca Heat Pump API."""
 
-    def __init__(self, username, password, host, config_path=None) -> None:
-        """Initialize the Orca API client."""
+    def __init__(
+        self,
+        username,
+        password,
+        host,
+        config_path=None,
+        session: aiohttp.ClientSession | None = None,
+        config_cache_path: Path | None = None,
+        max_connections: int = MAX_CONNECTIONS_PER_HOST,
+        write_coalesce_delay: float = WRITE_COALESCE_DELAY,
+        cache_ttl: float = READ_CACHE_TTL,
+    ) -> None:
+        """Initialize the Orca API client.
+
+        If no session is given, the client creates its own pooled session on first
+        use and closes it in close(). A provided session is never closed by the
+        client; it should use a cookie jar that accepts IP hosts (unsafe=True).
+        max_connections limits parallel requests to the device, including
+        concurrently issued readTags batches. If config_cache_path is set, the
+        validated config.yml is cached there and reused while unchanged.
+        Values of configured tags are cached for cache_ttl seconds, 0 disables
+        the cache but concurrent reads of the same tags are still merged.
+        """
         self.username = username
         self.password = password
         self.host = host
         self.available_circuits: list[int] = [0]
-        self._token = None
+
+        self._base_url = URL(f"http://{host}")
+        self._session = session
+        self._owns_session = session is None
+        self._max_connections = max_connections
+        self.request_scheduler = RequestScheduler(max_connections)
+        self.circuit_breaker = CircuitBreaker()
+        # successful requests still timed with MAX_REQUEST_TIMEOUT after a timeout
+        self._widened_requests = 0
+        self._auth_lock = asyncio.Lock()
+        self._token_issued: float | None = None
+        self._token_lifetime: float | None = None
+        self.stats = OrcaApiStats()
+        self.request_planner = RequestPlanner()
+        self._write_coalesce_delay = write_coalesce_delay
+        # open write batch (tag -> converted value) and the task sending it
+        self._write_batch: tuple[dict[str, str], asyncio.Task[None]] | None = None
+        # batches being sent, referenced until done
+        self._writes_in_flight: set[asyncio.Task[None]] = set()
+        self._cache_ttl = cache_ttl
+        # tag -> (monotonic time of the read, raw value)
+        self._read_cache: dict[str, tuple[float, str]] = {}
+        # tag -> read in flight that includes it, awaited by every caller needing it
+        self._reads_in_flight: dict[str, asyncio.Task[dict[str, str]]] = {}
+        # bumped by writes, reads started before a write do not fill the cache
+        self._cache_epoch = 0
 
         # _config holds the validated Pydantic models
         self._config: list[OrcaTagConfig] = []
         self._config_by_tags: dict[str, OrcaTagConfig] = {}
         self._config_by_ids: dict[str, OrcaTagConfig] = {}
+        self._codecs: dict[str, TagCodec] = {}
+        self.derived_metrics: list[DerivedMetric] = []
 
         # Resolve config path
         if config_path:
@@ -80,6 +658,20 @@ class OrcaApi:
         else:
             current_dir = Path(__file__).parent
             self._config_path = current_dir / "config.yml"
+        self._config_cache_path = config_cache_path
+
+    async def __aenter__(self) -> "OrcaApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release the device user slot and close the session if owned."""
+        await self.logout()
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
 
     async def initialize(self):
         """Load configuration and authenticate.
@@ -87,18 +679,59 @@ class OrcaApi:
         Loads config, authenticates, determines circuit names,
         and updates tag definitions accordingly.
         """
+        available_circuits, configs = await self.discover()
+        self.set_layout(available_circuits, configs)
+
+    async def discover(self) -> tuple[list[int], list[OrcaTagConfig]]:
+        """Probes the heat pump for configured circuits and their names.
+
+        Returns available circuits and the filtered/renamed configs without
+        changing the active layout, see set_layout().
+        """
         # Load raw configuration and convert to OrcaTagConfig models
         initial_config = await self._load_config()
 
-        # Temporary map for circuit detection logic
-        self._config_by_tags = {s.tag: s for s in initial_config}
+        # Conversion only depends on type, value map and range, renaming keeps it
+        self._codecs.update({s.tag: _compile_codec(s) for s in initial_config})
+
+        # Authenticate and determine valid circuits, behind polls and writes
+        with request_priority(RequestPriority.BACKGROUND):
+            return await self._filter_and_rename_circuits(initial_config)
+
+    def export_layout(self) -> dict[str, Any]:
+        """Returns discovered circuits and configs as JSON serializable data."""
+        return {
+            "available_circuits": self.available_circuits,
+            "configs": _CONFIG_ADAPTER.dump_python(self._config, mode="json"),
+        }
 
-        # Authenticate and determine valid circuits
-        self._config = await self._filter_and_rename_circuits(initial_config)
+    def restore_layout(self, layout: dict[str, Any]) -> None:
+        """Activates a layout from export_layout() without probing the device.
 
+        Raises ValueError if the stored layout does not validate.
+        """
+        try:
+            configs = _CONFIG_ADAPTER.validate_python(layout["configs"])
+            available_circuits = [int(c) for c in layout["available_circuits"]]
+        except (KeyError, TypeError, ValidationError) as err:
+            raise ValueError(f"Invalid stored layout: {err}") from err
+        self._codecs.update({s.tag: _compile_codec(s) for s in configs})
+        self.set_layout(available_circuits, configs)
+
+    def set_layout(
+        self, available_circuits: list[int], configs: list[OrcaTagConfig]
+    ) -> None:
+        """Activates discovered circuits and their filtered/renamed configs."""
+        self.available_circuits = available_circuits
+        self._config = configs
         # Rebuild lookups with final filtered/renamed config
-        self._config_by_tags = {s.tag: s for s in self._config}
-        self._config_by_ids = {s.unique_id: s for s in self._config}
+        self._config_by_tags = {s.tag: s for s in configs}
+        self._config_by_ids = {s.unique_id: s for s in configs}
+
+    @property
+    def tag_configs(self) -> list[OrcaTagConfig]:
+        """Returns configuration of all tags available on this heat pump."""
+        return self._config
 
     async def fetch_all(self) -> list[OrcaTagValue]:
         """Fetches all tags defined in config.
@@ -119,46 +752,212 @@ class OrcaApi:
             self._config_by_ids[_id].tag for _id in ids if _id in self._config_by_ids
         ]
         values = await self._get_bulk_values(tags)
-        return {v.config.id: v for v in values}
+        return {v.config.unique_id: v for v in values}
+
+    async def fetch_raw(
+        self, tags: list[str], batch_size: int | None = None
+    ) -> dict[str, str]:
+        """Reads any tags, configured or not, and returns their raw values.
+
+        Tags unknown to the device are left out, "-9999" is kept. Meant for
+        tools scanning the device for tags, the adaptive batch size is not
+        affected.
+        """
+        uris = self.request_planner.build(tags, batch_size or self.request_planner.batch_size)
+        with request_priority(RequestPriority.BACKGROUND):
+            return await self._read_batches(uris)
 
     async def set_value_by_tag(self, tag: str, value: Any):
         """Sets a value on the heat pump by tag.
 
         Performs necessary type conversions (e.g. float 22.5 -> int 225).
         """
-        if tag not in self._config_by_tags:
-            raise ValueError(f"Tag {tag} is not defined in configuration.")
+        await self.set_values({tag: value})
+
+    async def set_value_by_id(self, id: str, value: Any):
+        return await self.set_values_by_id({id: value})
 
-        config = self._config_by_tags[tag]
-        if not config.adjustable.enabled:
-            raise ValueError(f"Tag {tag} is not marked as adjustable.")
+    async def set_values(self, values: dict[str, Any]):
+        """Sets several values on the heat pump, keyed by tag.
 
-        converted_val = self._prepare_value_for_write(value, config)
+        All values are validated before anything is sent. Writes issued by
+        other callers within the coalescing window share one writeTags request.
+        """
+        self.circuit_breaker.raise_if_open()
+        if converted := self._encode_values(values):
+            await self._write_coalesced(converted)
 
-        url = f"http://{self.host}/cgi/writeTags?n=1&t1={tag}&v1={converted_val}"
-        await self._make_request(url)
+    async def set_values_by_id(self, values: dict[str, Any]):
+        """Sets several values on the heat pump, keyed by unique ID."""
+        await self.set_values(self._tags_by_id(values))
 
-    async def set_value_by_id(self, id: str, value: Any):
-        config = self._config_by_ids.get(id)
-        if not config:
-            raise ValueError(f"Tag with ID {id} is not defined in configuration.")
-        return await self.set_value_by_tag(tag=config.tag, value=value)
+    def _encode_values(self, values: dict[str, Any]) -> dict[str, str]:
+        """Converts values keyed by tag for writeTags.
+
+        Raises ValueError for unknown or read-only tags and invalid values.
+        """
+        converted = {}
+        for tag, value in values.items():
+            if tag not in self._config_by_tags:
+                raise ValueError(f"Tag {tag} is not defined in configuration.")
+
+            config = self._config_by_tags[tag]
+            if not config.adjustable.enabled:
+                raise ValueError(f"Tag {tag} is not marked as adjustable.")
+
+            converted[tag] = self._codecs[tag].encode(value)
+        return converted
+
+    def validate_values_by_id(self, values: dict[str, Any]) -> None:
+        """Raises ValueError unless all values keyed by unique ID can be written."""
+        self._encode_values(self._tags_by_id(values))
+
+    def _tags_by_id(self, values: dict[str, Any]) -> dict[str, Any]:
+        by_tag = {}
+        for id, value in values.items():
+            config = self._config_by_ids.get(id)
+            if not config:
+                raise ValueError(f"Tag with ID {id} is not defined in configuration.")
+            by_tag[config.tag] = value
+        return by_tag
+
+    async def _write_coalesced(self, converted: dict[str, str]) -> None:
+        """Joins the pending write batch or opens a new one, waits until sent.
+
+        The batch is sent by a task of its own after the coalescing window, so
+        a cancelled writer does not drop the values of the others who joined.
+        A later write to the same tag within the window wins.
+        """
+        if self._write_batch is not None:
+            batch, send = self._write_batch
+            batch.update(converted)
+        else:
+            batch = dict(converted)
+            send = asyncio.ensure_future(self._send_write_batch(batch))
+            self._write_batch = (batch, send)
+            self._writes_in_flight.add(send)
+            send.add_done_callback(self._write_done)
+        await asyncio.shield(send)
+
+    async def _send_write_batch(self, batch: dict[str, str]) -> None:
+        try:
+            await asyncio.sleep(self._write_coalesce_delay)
+        finally:
+            self._write_batch = None
+        await self._write_tags(batch)
+
+    def _write_done(self, send: asyncio.Task[None]) -> None:
+        self._writes_in_flight.discard(send)
+        if not send.cancelled():
+            # retrieved here in case every writer was cancelled
+            send.exception()
+
+    async def _write_tags(self, values: dict[str, str]) -> None:
+        """Sends already converted values, WRITE_BATCH_SIZE tags per request.
+
+        The read cache is dropped once the write is done, also when it failed
+        part way.
+        """
+        items = list(values.items())
+        try:
+            with request_priority(RequestPriority.WRITE):
+                for start in range(0, len(items), WRITE_BATCH_SIZE):
+                    chunk = items[start : start + WRITE_BATCH_SIZE]
+                    params = "".join(
+                        f"&t{i}={tag}&v{i}={value}"
+                        for i, (tag, value) in enumerate(chunk, 1)
+                    )
+                    url = f"http://{self.host}/cgi/writeTags?n={len(chunk)}{params}"
+                    await self._make_request(url)
+        finally:
+            self._invalidate()
 
     async def _load_config(self) -> list[OrcaTagConfig]:
-        """Reads YAML and converts to Pydantic models."""
+        """Reads YAML and converts to Pydantic models.
+
+        Uses the compiled config cache when its key matches config.yml content
+        and the integration version, otherwise parses and refreshes the cache.
+        """
         if not Path.exists(self._config_path):
             raise FileNotFoundError(f"Config file not found at {self._config_path}")
 
-        async with aiofiles.open(self._config_path, encoding="utf8") as f:
+        async with aiofiles.open(self._config_path, "rb") as f:
             content = await f.read()
-            yaml_data = yaml.safe_load(content) or {}
 
-        adapter = TypeAdapter(list[OrcaTagConfig])
-        return adapter.validate_python(yaml_data)
+        if self._config_cache_path is None:
+            configs, self.derived_metrics = self._parse_config(content)
+            return configs
+
+        key = await self._config_cache_key(content)
+        if (cache := await self._read_config_cache(key)) is not None:
+            self.derived_metrics = cache.derived
+            return cache.configs
+
+        configs, self.derived_metrics = self._parse_config(content)
+        await self._write_config_cache(key, configs, self.derived_metrics)
+        return configs
+
+    async def load_derived_metrics(self) -> list[DerivedMetric]:
+        """Returns derived metrics declared in config.yml.
+
+        They are loaded with the tag configuration; a restored layout skips
+        that, so this reads them separately.
+        """
+        await self._load_config()
+        return self.derived_metrics
+
+    @staticmethod
+    def _parse_config(
+        content: bytes,
+    ) -> tuple[list[OrcaTagConfig], list[DerivedMetric]]:
+        """Splits config.yml into tag configs and derived metrics."""
+        yaml_data = yaml.load(content, Loader=_YAML_LOADER) or []
+        tags = [item for item in yaml_data if "derived" not in item]
+        derived = [
+            DerivedMetric.model_validate(item) for item in yaml_data if "derived" in item
+        ]
+        return _CONFIG_ADAPTER.validate_python(tags), derived
+
+    @staticmethod
+    async def _config_cache_key(content: bytes) -> str:
+        """Returns cache key from cache format, integration version and content hash."""
+        manifest_path = Path(__file__).parent / "manifest.json"
+        async with aiofiles.open(manifest_path, encoding="utf8") as f:
+            version = json.loads(await f.read()).get("version", "")
+        digest = hashlib.sha256(content).hexdigest()
+        return f"{CONFIG_CACHE_FORMAT}-{version}-{digest}"
+
+    async def _read_config_cache(self, key: str) -> _ConfigCache | None:
+        try:
+            async with aiofiles.open(self._config_cache_path, "rb") as f:
+                cache = _ConfigCache.model_validate_json(await f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as err:
+            _LOGGER.debug("Ignoring unreadable config cache: %s", err)
+            return None
+
+        if cache.key != key:
+            _LOGGER.debug("Config cache is outdated, rebuilding")
+            return None
+        return cache
+
+    async def _write_config_cache(
+        self, key: str, configs: list[OrcaTagConfig], derived: list[DerivedMetric]
+    ):
+        """Writes the cache atomically, failures only cost the next startup."""
+        tmp_path = f"{self._config_cache_path}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "w", encoding="utf8") as f:
+                cache = _ConfigCache(key=key, configs=configs, derived=derived)
+                await f.write(cache.model_dump_json())
+            await aiofiles.os.replace(tmp_path, self._config_cache_path)
+        except OSError as err:
+            _LOGGER.warning("Could not write config cache: %s", err)
 
     async def _filter_and_rename_circuits(
         self, config_entries: list[OrcaTagConfig]
-    ) -> list[OrcaTagConfig]:
+    ) -> tuple[list[int], list[OrcaTagConfig]]:
         """Post-initialization to set final names and unique ID.
 
         Determines which heating circuits are used by heat pump by checking
@@ -166,14 +965,15 @@ class OrcaApi:
         Furthermore, circuits defined in "name_tags" are used to generate dynamic
         name according to name set in heat pump (TALNO, FLOOR, RADIATOR...)
 
-        Returns only circuits that are actually configured.
+        Returns available circuits and configs of circuits that are actually configured.
         """
+        config_by_tags = {s.tag: s for s in config_entries}
 
         # Tags that define the name of heating circuit
         # likely result: {1: "MK1_IME", 2: "MK1_IME(2)"}
         name_tags_map = {
             s.heating_circuit: tag
-            for tag, s in self._config_by_tags.items()
+            for tag, s in config_by_tags.items()
             if s.id == "hc_name"
         }
 
@@ -192,21 +992,22 @@ class OrcaApi:
             t for tags in circuit_tags.values() for t in tags
         ]
 
-        results = await self._get_bulk_values(tags=tags_to_get)
+        results = await self._get_bulk_values(tags_to_get, config_by_tags)
         results_map = {v.tag: v for v in results}
 
+        # circuit 0 is the default circuit that is always present
+        available_circuits = [0]
         for circuit_id, tags in circuit_tags.items():
             # means at least one tag in the results have value of True - the circuit is available
-            # note that self.available_circuits is initiated with [0] - the default circuit that is always present.
             for tag in tags:
                 if results_map.get(tag) and results_map[tag].value:
-                    self.available_circuits.append(circuit_id)
+                    available_circuits.append(circuit_id)
                     break
 
         final_config = []
 
         for config in config_entries:
-            if config.heating_circuit not in self.available_circuits:
+            if config.heating_circuit not in available_circuits:
                 continue
 
             unique_id = config.id
@@ -238,184 +1039,415 @@ class OrcaApi:
 
             final_config.append(updated_config)
 
-        return final_config
+        return available_circuits, final_config
+
+    async def _get_bulk_values(
+        self,
+        tags: list[str],
+        config_by_tags: dict[str, OrcaTagConfig] | None = None,
+    ) -> list[OrcaTagValue]:
+        """Internal method to fetch multiple tags.
 
-    async def _get_bulk_values(self, tags: list[str]) -> list[OrcaTagValue]:
-        """Internal method to fetch multiple tags."""
+        config_by_tags defaults to the active configuration.
+        """
         result = []
         if not tags:
             return result
 
-        parsed_data = {}
-        for uri in self._generate_uri(tags):
-            url = f"http://{self.host}{uri}"
-            response_text = await self._make_request(url)
-            parsed_data |= self._parse_response(response_text)
+        parsed_data = await self._read_shared(tags)
 
+        if config_by_tags is None:
+            config_by_tags = self._config_by_tags
+        codecs = self._codecs
         for tag, raw_val_str in parsed_data.items():
-            config = self._config_by_tags[tag]
-
             # Check for non-existent sensors
             if raw_val_str == "-9999":
+                self.stats.invalid_values += 1
                 continue
 
-            processed_value = self._convert_read_value(raw_val_str, config)
+            processed_value = codecs[tag].decode(raw_val_str)
             if processed_value is not None:
-                result.append(OrcaTagValue(tag=tag, value=processed_value, config=config))
+                result.append(OrcaTagValue(tag, processed_value, config_by_tags[tag]))
             else:
+                self.stats.conversion_errors += 1
                 _LOGGER.error(f"Failed to convert value \"{raw_val_str}\" to configured type.")
 
         return result
 
-    async def _make_request(self, url: str, attempt_auth=True) -> str:
-        """Handles HTTP request with auth retry logic."""
-        cookies = {"IDALToken": self._token} if self._token else {}
+    async def _read_shared(self, tags: list[str]) -> dict[str, str]:
+        """Returns raw values of tags, reading only those not cached or in flight.
 
+        Missing tags are read in a task of their own, so a cancelled caller
+        does not fail the others waiting for it.
+        """
+        now = time.monotonic()
+        stats = self.stats
+        values: dict[str, str] = {}
+        missing: list[str] = []
+        joined: set[asyncio.Task[dict[str, str]]] = set()
+        cache, ttl = self._read_cache, self._cache_ttl
+        for tag in tags:
+            if (cached := cache.get(tag)) is not None and now - cached[0] < ttl:
+                values[tag] = cached[1]
+                stats.cache_hits += 1
+            elif (read := self._reads_in_flight.get(tag)) is not None:
+                joined.add(read)
+                stats.merged_reads += 1
+            else:
+                missing.append(tag)
+        stats.cache_misses += len(missing)
+
+        if missing:
+            read = asyncio.ensure_future(self._read_missing(missing))
+            for tag in missing:
+                self._reads_in_flight[tag] = read
+            read.add_done_callback(self._read_done)
+            joined.add(read)
+
+        for read in joined:
+            values.update(await asyncio.shield(read))
+        return {tag: values[tag] for tag in tags if tag in values}
+
+    async def _read_missing(self, tags: list[str]) -> dict[str, str]:
+        epoch = self._cache_epoch
+        planner = self.request_planner
+        start = time.perf_counter()
+        try:
+            parsed_data = await self._read_batches(planner.plan(tags))
+        except RuntimeError:
+            # only an #E_ answer of the firmware can be about the batch size,
+            # connection errors and timeouts (outages, Wi-Fi) are not
+            planner.record_error(len(tags))
+            raise
+        planner.record(len(tags), time.perf_counter() - start)
+        if self._cache_ttl and epoch == self._cache_epoch:
+            now = time.monotonic()
+            self._read_cache.update((tag, (now, value)) for tag, value in parsed_data.items())
+        return parsed_data
+
+    def _read_done(self, read: asyncio.Task[dict[str, str]]) -> None:
+        for tag, in_flight in list(self._reads_in_flight.items()):
+            if in_flight is read:
+                del self._reads_in_flight[tag]
+        if not read.cancelled():
+            # retrieved here in case every caller was cancelled
+            read.exception()
+
+    def _invalidate(self) -> None:
+        """Forgets cached values after a write, later reads go to the device.
+
+        A write can change other tags too (e.g. a mode switching a pump), so
+        nothing cached or in flight is trusted afterwards.
+        """
+        self._cache_epoch += 1
+        self._read_cache.clear()
+        self._reads_in_flight.clear()
+
+    async def _read_batches(self, uris: list[str]) -> dict[str, str]:
+        """Issues readTags batches concurrently and merges results as they arrive.
+
+        Concurrency is bounded by the per-host request slots (max_connections).
+        """
+        urls = [f"http://{self.host}{uri}" for uri in uris]
+        parsed_data = {}
+        if len(urls) == 1:
+            self._parse_response(await self._make_request(urls[0]), parsed_data)
+            return parsed_data
+
+        tasks = [asyncio.ensure_future(self._make_request(url)) for url in urls]
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                self._parse_response(await next_response, parsed_data)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return parsed_data
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the long-lived session, creating an owned one if needed."""
+        if self._session is None or (self._owns_session and self._session.closed):
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._max_connections,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                # IDALToken is set for an IP address, which the default jar rejects
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+            )
+            self._owns_session = True
+        return self._session
+
+    @property
+    def _token(self) -> str | None:
+        """Returns the session token stored in the cookie jar."""
+        if self._session is None:
+            return None
+        cookie = self._session.cookie_jar.filter_cookies(self._base_url).get(
+            TOKEN_COOKIE
+        )
+        return cookie.value if cookie else None
+
+    @property
+    def request_timeout(self) -> float:
+        """Seconds a request may take, derived from recent latencies."""
+        latency = self.stats.request_latency
+        if (
+            len(latency) < TIMEOUT_MIN_SAMPLES
+            or self._widened_requests
+            or self.circuit_breaker.state is not CircuitState.CLOSED
+        ):
+            return MAX_REQUEST_TIMEOUT
+        return min(
+            MAX_REQUEST_TIMEOUT,
+            max(MIN_REQUEST_TIMEOUT, TIMEOUT_LATENCY_FACTOR * latency.percentile(95)),
+        )
+
+    async def _get(self, url: str) -> bytes:
+        """Performs GET on the shared session, limited per host.
+
+        Raises DeviceUnavailableError without a request while the circuit
+        breaker is open.
+        """
+        session = self._get_session()
+        stats = self.stats
+        breaker = self.circuit_breaker
+        probe = False
         try:
-            async with aiohttp.ClientSession(cookies=cookies) as session:
-                async with session.get(url, timeout=10) as resp:
-                    data = await resp.text()
+            async with self.request_scheduler.slot(_REQUEST_PRIORITY.get()):
+                # checked once a slot is free, the state may have changed meanwhile
+                probe = breaker.before_request()
+                total = self.request_timeout
+                timeout = aiohttp.ClientTimeout(
+                    total=total, sock_connect=min(total, CONNECT_TIMEOUT)
+                )
+                start = time.perf_counter()
+                stats.requests += 1
+                async with session.get(url, timeout=timeout) as resp:
+                    data = await resp.read()
+                stats.request_latency.add(time.perf_counter() - start)
+                stats.bytes_received += len(data)
+                if self._widened_requests:
+                    self._widened_requests -= 1
+                breaker.record_success()
+                return data
         except aiohttp.ClientError as e:
+            stats.request_errors += 1
+            breaker.record_failure()
             raise ConnectionError(f"Failed to connect to heat pump: {e}")
         except asyncio.TimeoutError:
+            stats.request_errors += 1
+            self._widened_requests = TIMEOUT_MIN_SAMPLES
+            breaker.record_failure()
             raise TimeoutError("Request to heat pump timed out.")
+        except asyncio.CancelledError:
+            if probe:
+                breaker.record_abandoned()
+            raise
+
+    async def _make_request(self, url: str, attempt_auth=True) -> bytes:
+        """Handles HTTP request with auth retry logic.
 
-        if "#E_NEED_LOGIN" in data or "E_NEED_LOGIN" in data:
+        Returns the raw response body, parsers work on bytes directly.
+        """
+        if attempt_auth and self._token_expired():
+            _LOGGER.debug("Token outlived its learned lifetime, authenticating again")
+            await self._login_once(self._token)
+
+        data = await self._get(url)
+
+        if b"E_NEED_LOGIN" in data:
             if attempt_auth:
                 _LOGGER.debug("Token expired or missing, authenticating again")
-                await self._authenticate()
+                expired_token = self._token
+                self._learn_token_lifetime()
+                await self._login_once(expired_token)
                 return await self._make_request(url, attempt_auth=False)
 
-        if "#E_" in data and "E_UNKNOWNTAG" not in data:
-            raise RuntimeError(f"API Error: {data}")
+        if b"#E_" in data and b"E_UNKNOWNTAG" not in data:
+            self.stats.request_errors += 1
+            raise RuntimeError(f"API Error: {data.decode(errors='replace')}")
         return data
 
+    async def logout(self) -> None:
+        """Logs out so the token does not hold one of the device's user slots.
+
+        The endpoint is not confirmed on the firmware and the answer is not
+        checked. The token is forgotten either way, an unreleased slot is
+        freed when the token expires.
+        """
+        if self._token is None:
+            return
+        try:
+            await self._get(f"http://{self.host}{LOGOUT_PATH}")
+        except (ConnectionError, TimeoutError) as err:
+            _LOGGER.debug("Logout failed, slot is freed when the token expires: %s", err)
+        self._clear_token()
+
+    def _clear_token(self) -> None:
+        if self._session is not None:
+            self._session.cookie_jar.clear(
+                lambda cookie: cookie.key == TOKEN_COOKIE
+                and cookie["domain"] == self._base_url.host
+            )
+        self._token_issued = None
+
+    def _token_expired(self) -> bool:
+        """Whether the token reached its learned lifetime."""
+        if self._token_lifetime is None or self._token_issued is None:
+            return False
+        return time.monotonic() - self._token_issued >= self._token_lifetime
+
+    def _learn_token_lifetime(self) -> None:
+        """Records the age of an expired token as the device's token lifetime."""
+        if self._token_issued is None:
+            return
+        age = time.monotonic() - self._token_issued
+        if age >= MIN_TOKEN_LIFETIME:
+            self._token_lifetime = min(age, self._token_lifetime or age)
+            _LOGGER.debug("Token lifetime is at most %.0f s", self._token_lifetime)
+
+    async def _login_once(self, stale_token: str | None) -> None:
+        """Single-flight login, callers holding the same stale token share it."""
+        async with self._auth_lock:
+            if self._token != stale_token:
+                # another request already logged in
+                return
+            await self._authenticate()
+            if stale_token is not None:
+                self.stats.relogins += 1
+
     async def _authenticate(self):
-        """Authenticates with the Heat Pump."""
+        """Authenticates with the Heat Pump.
+
+        Retries with exponential backoff and full jitter while all user slots
+        of the device are taken, up to LOGIN_MAX_ATTEMPTS attempts.
+        """
         login_url = f"http://{self.host}/cgi/login?username={self.username}&password={self.password}"
 
-        while True:
+        for attempt in range(LOGIN_MAX_ATTEMPTS):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(login_url, timeout=10) as resp:
-                        text = await resp.text()
+                text = (await self._get(login_url)).decode(errors="replace")
+            except DeviceUnavailableError:
+                raise
             except Exception as e:
                 raise ConnectionError(f"Auth connection failed: {e}")
 
-            if "IDALToken" in text:
-                match = re.search(r"IDALToken=([^\s]+)", text)
+            if TOKEN_COOKIE in text:
+                match = re.search(rf"{TOKEN_COOKIE}=([^\s]+)", text)
                 if match:
-                    self._token = match.group(1)
+                    self._get_session().cookie_jar.update_cookies(
+                        {TOKEN_COOKIE: match.group(1)}, self._base_url
+                    )
+                    self._token_issued = time.monotonic()
+                    self.stats.logins += 1
                     _LOGGER.debug("Authentication successful")
                     return
                 else:
                     raise ValueError("Token not found in successful login response.")
 
             elif "#E_TOO_MANY_USERS" in text:
-                _LOGGER.warning("Too many users. Retrying in 5s")
-                await asyncio.sleep(5)
+                self.stats.login_slot_waits += 1
+                if attempt + 1 == LOGIN_MAX_ATTEMPTS:
+                    break
+                delay = random.uniform(
+                    0, min(LOGIN_BACKOFF_MAX, LOGIN_BACKOFF_BASE * 2**attempt)
+                )
+                _LOGGER.warning("Too many users. Retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
                 continue
             elif "#E_PASS_DONT_MATCH" in text:
                 raise PermissionError("Login failed: Incorrect credentials.")
             else:
                 raise PermissionError(f"Login failed: {text}")
 
-    def _generate_uri(self, tags: list[str]) -> list[str]:
-        """Batches tags into URL parameters."""
-        params = ""
-        count = 0
-        uris = []
-        for tag in tags:
-            count += 1
-            params += f"&t{count}={tag}"
-            if count >= 150:
-                uris.append(f"/cgi/readTags?client=OrcaTouch1172&n={count}{params}")
-                params = ""
-                count = 0
-        if count > 0:
-            uris.append(f"/cgi/readTags?client=OrcaTouch1172&n={count}{params}")
-        return uris
-
-    def _parse_response(self, raw_data: str) -> dict[str, str]:
-        """Parses the raw hash/semicolon separated response."""
-        results = {}
-        entries = raw_data.strip().split("#")
-
-        for entry in entries:
-            clean_entry = entry.replace("\t", ";").replace("\n", ";")
-            parts = clean_entry.split(";")
+        raise ConnectionError(
+            f"Login failed: too many users after {LOGIN_MAX_ATTEMPTS} attempts."
+        )
 
-            if len(parts) < 4:
-                continue
+    def _parse_response(self, raw_data: bytes, results: dict[str, str]) -> None:
+        """Parses the raw hash/semicolon separated response into results.
 
-            tag_name = parts[0]
-            status = parts[1]
-            val = parts[3]
+        The body is decoded once and scanned in a single regex pass that yields
+        (tag, value) pairs straight into results, without per-entry splitting.
+        """
+        results.update(_RESPONSE_ENTRY.findall(raw_data.decode(errors="replace")))
 
-            if status != "S_OK":
-                continue
 
-            results[tag_name] = val
+def _parse_number(raw_value: str) -> int | float | str:
+    """Parses API number the way the device formats it, int before float."""
+    try:
+        return int(raw_value)
+    except ValueError:
+        try:
+            return float(raw_value)
+        except ValueError:
+            return raw_value
 
-        return results
 
-    def _convert_read_value(self, raw_value: str, config: OrcaTagConfig) -> Any:
-        """Converts string from API to typed Python object."""
+def _compile_codec(config: OrcaTagConfig) -> TagCodec:
+    """Builds decode/encode functions for one tag, with its limits and maps bound."""
+    if isinstance(config, FloatSensor):
+        range_min = config.adjustable.range.min
+        range_max = config.adjustable.range.max
 
-        def safe_num(v):
+        def decode(raw_value: str) -> float | None:
             try:
-                return int(v)
+                # values are integers in tenths, e.g. 225 -> 22.5
+                return round(int(raw_value) / 10.0, 1)
             except ValueError:
-                try:
-                    return float(v)
-                except ValueError:
-                    return v
-
-        val = safe_num(raw_value)
-
-        if isinstance(config, FloatSensor):
-            if isinstance(val, int):
-                return round(val / 10.0, 1)
-
-        if isinstance(config, BooleanSensor):
-            if val in (0, 1):
-                return val == 1
-
-        if isinstance(config, MultimodeSensor):
-            if isinstance(val, int) and val in config.value_map:
-                return config.value_map[val]
-
-        return None
+                return None
 
-    def _prepare_value_for_write(self, input_value: Any, config: OrcaTagConfig) -> str:
-        """Prepares a Python value to be sent to the API."""
-
-        if isinstance(config, FloatSensor):
+        def encode(input_value: Any) -> str:
             try:
                 float_val = float(input_value)
             except ValueError:
                 raise ValueError(f"Invalid numeric value: {input_value}")
-            if (
-                float_val < config.adjustable.range.min
-                or float_val > config.adjustable.range.max
-            ):
+            if float_val < range_min or float_val > range_max:
                 raise ValueError(
-                    f"Value {float_val} out of range ({config.adjustable.range.min} - {config.adjustable.range.max})"
+                    f"Value {float_val} out of range ({range_min} - {range_max})"
                 )
             return str(int(float_val * 10))
 
-        elif isinstance(config, BooleanSensor):
+    elif isinstance(config, BooleanSensor):
+        booleans = {"0": False, "1": True}
+
+        def decode(raw_value: str) -> bool | None:
+            if (value := booleans.get(raw_value)) is not None:
+                return value
+            val = _parse_number(raw_value)
+            return val == 1 if val in (0, 1) else None
+
+        def encode(input_value: Any) -> str:
             if isinstance(input_value, bool):
                 return "1" if input_value else "0"
             raise ValueError("Provided value is not boolean")
 
-        elif isinstance(config, MultimodeSensor):
+    elif isinstance(config, MultimodeSensor):
+        value_map = config.value_map
+        by_raw = {str(k): v for k, v in value_map.items()}
+        reverse_map = {v: str(k) for k, v in value_map.items()}
+        options = list(value_map.values())
+
+        def decode(raw_value: str) -> str | None:
+            if (value := by_raw.get(raw_value)) is not None:
+                return value
+            val = _parse_number(raw_value)
+            return value_map.get(val) if isinstance(val, int) else None
+
+        def encode(input_value: Any) -> str:
             str_val = str(input_value)
-            reverse_map = {v: k for k, v in config.value_map.items()}
             if str_val in reverse_map:
-                return str(reverse_map[str_val])
-            raise ValueError(
-                f"Invalid mode value: {str_val}. Valid options: {list(config.value_map.values())}"
-            )
+                return reverse_map[str_val]
+            raise ValueError(f"Invalid mode value: {str_val}. Valid options: {options}")
+
+    else:
+
+        def decode(raw_value: str) -> None:
+            return None
+
+        def encode(input_value: Any) -> str:
+            return str(input_value)
 
-        return str(input_value)
+    return TagCodec(decode, encode)
@@ -0,0 +1,135 @@
+"""Staggered polling of all Orca heat pumps handled by one Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import logging
+import math
+import time
+from typing import Any
+
+from .orca_api import SampleWindow
+
+_LOGGER = logging.getLogger(__name__)
+
+# creates a task from a coroutine and a task name, e.g. a config entry's
+# async_create_background_task so Home Assistant tracks the polls
+TaskFactory = Callable[[Coroutine[Any, Any, Any], str], asyncio.Task]
+
+
+def _create_task(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+    return asyncio.create_task(coro, name=name)
+
+
+class PollScheduler:
+    """Polls every registered device once per interval, phases spread evenly.
+
+    With n devices the polls start interval / n apart instead of bursting
+    together. A poll still running when its next turn comes is skipped. The
+    phases are recomputed whenever a device is added or removed.
+
+    Timer loops and polls run in tasks of the device's task factory. Both are
+    referenced until done, remove() cancels them and waits for them to end.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._epoch = time.monotonic()
+        self._polls: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._task_factories: dict[str, TaskFactory] = {}
+        # timer loop and poll in progress per device
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._running: dict[str, asyncio.Task] = {}
+        # aggregate load over all devices
+        self.polls = 0
+        self.skipped_polls = 0
+        self.max_concurrent = 0
+        # seconds between scheduled and actual start, and per poll
+        self.start_lag = SampleWindow()
+        self.duration = SampleWindow()
+
+    def add(
+        self,
+        key: str,
+        poll: Callable[[], Awaitable[Any]],
+        create_task: TaskFactory = _create_task,
+    ) -> None:
+        """Starts polling, poll is called once per interval in its own phase."""
+        self._cancel(key)
+        self._polls[key] = poll
+        self._task_factories[key] = create_task
+        self._tasks[key] = create_task(self._run(key), f"orca_poll_{key}")
+
+    async def remove(self, key: str) -> None:
+        """Stops polling key, also a poll in progress, and waits until it ended.
+
+        Other devices move to their new phases.
+        """
+        if tasks := self._cancel(key):
+            await asyncio.wait(tasks)
+
+    def _cancel(self, key: str) -> list[asyncio.Task]:
+        self._polls.pop(key, None)
+        self._task_factories.pop(key, None)
+        tasks = [
+            task
+            for task in (self._tasks.pop(key, None), self._running.pop(key, None))
+            if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    def phase(self, key: str) -> float:
+        """Offset of key's polls within the interval, in seconds."""
+        keys = list(self._polls)
+        return keys.index(key) * self.interval / len(keys)
+
+    def next_start(self, key: str, now: float) -> float:
+        """Monotonic time of key's next poll after now."""
+        offset = self._epoch + self.phase(key)
+        cycles = math.floor((now - offset) / self.interval) + 1
+        return offset + cycles * self.interval
+
+    async def _run(self, key: str) -> None:
+        while True:
+            start = self.next_start(key, time.monotonic())
+            await asyncio.sleep(start - time.monotonic())
+            if key in self._running:
+                self.skipped_polls += 1
+                _LOGGER.debug("Skipping poll of %s, previous one is still running", key)
+                continue
+            self.start_lag.add(time.monotonic() - start)
+            # the poll runs on its own, a slow device does not shift the next phase
+            self._task_factories[key](self._poll(key), f"orca_poll_{key}_run")
+
+    async def _poll(self, key: str) -> None:
+        if (poll := self._polls.get(key)) is None:
+            return
+        # registered by the task itself, it may have been started eagerly
+        self._running[key] = asyncio.current_task()
+        self.polls += 1
+        self.max_concurrent = max(self.max_concurrent, len(self._running))
+        start = time.monotonic()
+        try:
+            await poll()
+        except Exception:  # noqa: BLE001 - a failing device must not stop the others
+            _LOGGER.exception("Unexpected error polling %s", key)
+        finally:
+            if self._running.get(key) is asyncio.current_task():
+                del self._running[key]
+            self.duration.add(time.monotonic() - start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the aggregate load as JSON serializable data."""
+        return {
+            "devices": len(self._polls),
+            "interval": self.interval,
+            "polls": self.polls,
+            "skipped_polls": self.skipped_polls,
+            "running": len(self._running),
+            "max_concurrent": self.max_concurrent,
+            "start_lag": self.start_lag.as_dict(),
+            "duration": self.duration.as_dict(),
+        }
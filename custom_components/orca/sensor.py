@@ -2,18 +2,103 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, EXCLUDED_IDS
+from .const import CONF_LANGUAGE, DOMAIN, LANG_SI
 from .coordinator import OrcaDataUpdateCoordinator
-from .entity import OrcaEntity
+from .entity import OrcaEntity, orca_device_info
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrcaMetricDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor of the integration's own performance."""
+
+    name_si: str
+    value_fn: Callable[[OrcaDataUpdateCoordinator], float | int | None]
+
+
+METRIC_SENSORS = (
+    OrcaMetricDescription(
+        key="poll_duration_p50",
+        name="Orca poll duration (median)",
+        name_si="Orca trajanje branja (mediana)",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda c: _milliseconds(c.poll_stats.duration.percentile(50)),
+    ),
+    OrcaMetricDescription(
+        key="poll_duration_p95",
+        name="Orca poll duration (95th percentile)",
+        name_si="Orca trajanje branja (95. percentil)",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda c: _milliseconds(c.poll_stats.duration.percentile(95)),
+    ),
+    OrcaMetricDescription(
+        key="requests_per_poll",
+        name="Orca requests per poll",
+        name_si="Orca zahtevki na branje",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c: c.poll_stats.requests,
+    ),
+    OrcaMetricDescription(
+        key="bytes_per_poll",
+        name="Orca data per poll",
+        name_si="Orca podatki na branje",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda c: c.poll_stats.bytes_received,
+    ),
+    OrcaMetricDescription(
+        key="poll_error_rate",
+        name="Orca poll error rate",
+        name_si="Orca delež neuspelih branj",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda c: c.poll_stats.error_rate,
+    ),
+    OrcaMetricDescription(
+        key="invalid_values",
+        name="Orca invalid values per poll",
+        name_si="Orca neveljavne vrednosti na branje",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c: c.poll_stats.invalid_values,
+    ),
+    OrcaMetricDescription(
+        key="suppressed_values",
+        name="Orca suppressed updates",
+        name_si="Orca zadržane posodobitve",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.poll_stats.suppressed_values,
+    ),
+    OrcaMetricDescription(
+        key="relogins",
+        name="Orca re-logins",
+        name_si="Orca ponovne prijave",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: c.api.stats.relogins,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -24,15 +109,17 @@ async def async_setup_entry(
     """Set up Orca sensors."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for unique_id, tag_value in coordinator.data.items():
-        if (
-            tag_value.config.type in ["float", "multimode"]
-            and not tag_value.config.adjustable.enabled
-            and tag_value.config.id not in EXCLUDED_IDS
-        ):
-            entities.append(OrcaSensor(coordinator, unique_id))
-
+    entities: list[SensorEntity] = [
+        OrcaSensor(coordinator, unique_id)
+        for unique_id in coordinator.entity_plan.sensors
+    ]
+    entities.extend(
+        OrcaDerivedSensor(coordinator, metric_id)
+        for metric_id in coordinator.derived.metrics
+    )
+    entities.extend(
+        OrcaMetricSensor(coordinator, description) for description in METRIC_SENSORS
+    )
     async_add_entities(entities)
 
 
@@ -59,3 +146,72 @@ class OrcaSensor(OrcaEntity, SensorEntity):
     def native_value(self):
         """Return the state of the sensor."""
         return self.tag_data.value
+
+
+class OrcaDerivedSensor(CoordinatorEntity[OrcaDataUpdateCoordinator], SensorEntity):
+    """Sensor of a derived metric declared in config.yml."""
+
+    _attr_has_entity_name = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: OrcaDataUpdateCoordinator, metric_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, context=frozenset({metric_id}))
+        self.metric_id = metric_id
+        metric = coordinator.derived.metrics[metric_id]
+        if coordinator.config_entry.data.get(CONF_LANGUAGE) == LANG_SI:
+            self._attr_name = metric.name.si.capitalize()
+        else:
+            self._attr_name = metric.name.en.capitalize()
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{metric_id}"
+        self._attr_device_info = orca_device_info(coordinator)
+        if metric.unit:
+            self._attr_native_unit_of_measurement = metric.unit
+
+    @property
+    def available(self) -> bool:
+        """Return if the metric could be computed from the last values."""
+        return self.native_value is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the current value of the metric."""
+        return self.coordinator.derived.values.get(self.metric_id)
+
+
+class OrcaMetricSensor(CoordinatorEntity[OrcaDataUpdateCoordinator], SensorEntity):
+    """Diagnostic sensor reporting how polling the heat pump performs.
+
+    Disabled by default, the values change with every poll.
+    """
+
+    entity_description: OrcaMetricDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = False
+
+    def __init__(
+        self,
+        coordinator: OrcaDataUpdateCoordinator,
+        description: OrcaMetricDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        if coordinator.config_entry.data.get(CONF_LANGUAGE) == LANG_SI:
+            self._attr_name = description.name_si
+        else:
+            self._attr_name = description.name
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        self._attr_device_info = orca_device_info(coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Metrics stay available when polls fail, they report the failures."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self.coordinator)
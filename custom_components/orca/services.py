@@ -0,0 +1,63 @@
+"""Services for the Orca integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import OrcaDataUpdateCoordinator
+
+SERVICE_SET_VALUES = "set_values"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_VALUES = "values"
+
+SET_VALUES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        # unique ID (e.g. hc_desired_day_temp_1) -> value
+        vol.Required(ATTR_VALUES): vol.Schema(
+            {cv.string: vol.Any(bool, int, float, str)}
+        ),
+    }
+)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: str | None
+) -> OrcaDataUpdateCoordinator:
+    """Returns coordinator of the given entry, or of the only configured one."""
+    coordinators: dict[str, OrcaDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise ServiceValidationError(f"Orca entry {entry_id} is not loaded.")
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise ServiceValidationError(
+            f"{ATTR_CONFIG_ENTRY_ID} is required when {len(coordinators)} Orca entries are loaded."
+        )
+    return next(iter(coordinators.values()))
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register Orca services."""
+
+    async def async_set_values(call: ServiceCall) -> None:
+        """Write several values in one writeTags request."""
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        values = call.data[ATTR_VALUES]
+        try:
+            await coordinator.async_set_values(values)
+        except HomeAssistantError:
+            raise
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        except Exception as err:
+            raise HomeAssistantError(f"Failed to write values: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_VALUES, async_set_values, schema=SET_VALUES_SCHEMA
+    )
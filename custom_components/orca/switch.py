@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, EXCLUDED_IDS
+from .const import DOMAIN
 from .coordinator import OrcaDataUpdateCoordinator
 from .entity import OrcaEntity
 
@@ -22,16 +22,10 @@ async def async_setup_entry(
     """Set up Orca switches."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for unique_id, tag_value in coordinator.data.items():
-        if (
-            tag_value.config.type == "boolean"
-            and tag_value.config.adjustable.enabled
-            and tag_value.config.id not in EXCLUDED_IDS
-        ):
-            entities.append(OrcaSwitch(coordinator, unique_id))
-
-    async_add_entities(entities)
+    async_add_entities(
+        OrcaSwitch(coordinator, unique_id)
+        for unique_id in coordinator.entity_plan.switches
+    )
 
 
 class OrcaSwitch(OrcaEntity, SwitchEntity):
@@ -44,10 +38,8 @@ class OrcaSwitch(OrcaEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await self.coordinator.api.set_value_by_id(self.unique_id_, True)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({self.unique_id_: True})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await self.coordinator.api.set_value_by_id(self.unique_id_, False)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({self.unique_id_: False})
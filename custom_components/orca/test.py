@@ -1,9 +1,13 @@
 import asyncio
+import sys
+
 from orca_api import OrcaApi
 
 
 async def main():
-    orca = OrcaApi(username="admin", password="admin", host="192.168.30.160")
+    # pass "127.0.0.1:8080" to run against development_resources/benchmarks/stand_in.py
+    host = sys.argv[1] if len(sys.argv) > 1 else "192.168.30.160"
+    orca = OrcaApi(username="admin", password="admin", host=host)
     await orca.initialize()
 
     # await orca.set_value_by_id("hc_desired_day_temp_1", 20.4)
@@ -29,11 +29,10 @@ async def async_setup_entry(
     """Set up the Orca water heater platform."""
     coordinator: OrcaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    # Circuit 4 is water heater as defined in config.yml
-    if 4 in coordinator.api.available_circuits:
-        entities.append(OrcaWaterHeater(coordinator, "wh_temp_top"))
-    async_add_entities(entities)
+    async_add_entities(
+        OrcaWaterHeater(coordinator, unique_id)
+        for unique_id in coordinator.entity_plan.water_heaters
+    )
 
 
 class OrcaWaterHeater(OrcaEntity, WaterHeaterEntity):
@@ -49,7 +48,16 @@ class OrcaWaterHeater(OrcaEntity, WaterHeaterEntity):
 
     def __init__(self, coordinator: OrcaDataUpdateCoordinator, unique_id: str) -> None:
         """Initialize."""
-        super().__init__(coordinator, unique_id)
+        super().__init__(
+            coordinator,
+            unique_id,
+            tracked_ids=[
+                "wh_desired_temp",
+                "wh_turned_on",
+                "valve_pos",
+                "outdoor_unit_pump",
+            ],
+        )
 
         if coordinator.config_entry.data.get(CONF_LANGUAGE, LANG_EN) == LANG_SI:
             self._attr_name = "Bojler"
@@ -90,15 +98,12 @@ class OrcaWaterHeater(OrcaEntity, WaterHeaterEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temp := kwargs.get("temperature")) is not None:
-            await self.coordinator.api.set_value_by_id("wh_desired_temp", temp)
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_values({"wh_desired_temp": temp})
 
     async def async_turn_away_mode_on(self) -> None:
         """Turn away mode on (Disable DHW)."""
-        await self.coordinator.api.set_value_by_id("wh_turned_on", False)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({"wh_turned_on": False})
 
     async def async_turn_away_mode_off(self) -> None:
         """Turn away mode off (Enable DHW)."""
-        await self.coordinator.api.set_value_by_id("wh_turned_on", True)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_values({"wh_turned_on": True})
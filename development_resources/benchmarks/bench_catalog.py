@@ -0,0 +1,59 @@
+"""Tag catalog throughput and memory for growing raw readTags dumps.
+
+Writes dumps of 10,000 to 1,000,000 entries over the same 2,000 tags (raw
+"#tag\tS_OK" format, as saved from readTags responses) and catalogs them.
+Python heap use has to stay flat as the dumps grow, it only depends on the
+tags. Mapped file pages count towards RSS but are not allocated memory, so the
+peak is measured with tracemalloc in a second, untimed pass.
+
+Usage: python development_resources/benchmarks/bench_catalog.py
+"""
+
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "dump_all"))
+import tag_catalog  # noqa: E402
+
+TAGS = 2000
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def write_dump(path: Path, entries: int) -> None:
+    with open(path, "w", encoding="utf8") as file:
+        for i in range(entries):
+            tag = i % TAGS
+            file.write(f"#2_Bench_{tag}\tS_OK\n192\t{(i // TAGS) % 50 + tag % 7}\n")
+
+
+def peak_heap_mb(path: Path) -> float:
+    tracemalloc.start()
+    tag_catalog.TagCatalog().add_snapshot(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for entries in SIZES:
+            path = Path(directory) / f"dump_{entries}.txt"
+            write_dump(path, entries)
+            size = path.stat().st_size / 1e6
+            catalog = tag_catalog.TagCatalog()
+            start = time.perf_counter()
+            catalog.add_snapshot(path)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{entries:>9} entries {size:7.1f} MB  {elapsed:6.2f} s  "
+                f"{size / elapsed:5.1f} MB/s  {len(catalog.tags)} tags  "
+                f"peak heap {peak_heap_mb(path):5.2f} MB"
+            )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
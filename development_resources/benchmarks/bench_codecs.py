@@ -0,0 +1,110 @@
+"""Decode time and memory per snapshot: pydantic values vs compiled codecs.
+
+The previous implementation validated a pydantic OrcaTagValue per tag and ran
+the generic _convert_read_value; it is reproduced here for comparison.
+
+Usage: python development_resources/benchmarks/bench_codecs.py
+"""
+
+import asyncio
+import timeit
+import tracemalloc
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import seed_values
+
+orca_api = load("orca_api")
+models = load("models")
+
+
+class LegacyTagValue(BaseModel):
+    tag: str
+    value: Union[float, int, bool, str, None]
+    config: models.OrcaTagConfig
+
+
+def legacy_convert_read_value(raw_value: str, config) -> Any:
+    def safe_num(v):
+        try:
+            return int(v)
+        except ValueError:
+            try:
+                return float(v)
+            except ValueError:
+                return v
+
+    val = safe_num(raw_value)
+    if isinstance(config, models.FloatSensor):
+        if isinstance(val, int):
+            return round(val / 10.0, 1)
+    if isinstance(config, models.BooleanSensor):
+        if val in (0, 1):
+            return val == 1
+    if isinstance(config, models.MultimodeSensor):
+        if isinstance(val, int) and val in config.value_map:
+            return config.value_map[val]
+    return None
+
+
+def legacy_decode(parsed, config_by_tags):
+    result = []
+    for tag, raw in parsed.items():
+        config = config_by_tags[tag]
+        if raw == "-9999":
+            continue
+        value = legacy_convert_read_value(raw, config)
+        if value is not None:
+            result.append(LegacyTagValue(tag=tag, value=value, config=config))
+    return result
+
+
+def current_decode(parsed, config_by_tags, codecs):
+    result = []
+    for tag, raw in parsed.items():
+        if raw == "-9999":
+            continue
+        value = codecs[tag].decode(raw)
+        if value is not None:
+            result.append(orca_api.OrcaTagValue(tag, value, config_by_tags[tag]))
+    return result
+
+
+def snapshot_memory(func) -> int:
+    tracemalloc.start()
+    snapshot = func()  # noqa: F841 - keep the snapshot alive while measuring
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    api = orca_api.OrcaApi("admin", "admin", "localhost", config_path=CONFIG_PATH)
+    configs = asyncio.run(api._load_config())
+    raw_values = seed_values()
+
+    for copies in (1, 8, 72):
+        config_by_tags, parsed = {}, {}
+        for i in range(copies):
+            for config in configs:
+                tag = f"{config.tag}#{i}"
+                config_by_tags[tag] = config.model_copy(update={"tag": tag})
+                parsed[tag] = raw_values[config.tag]
+        codecs = {tag: orca_api._compile_codec(c) for tag, c in config_by_tags.items()}
+
+        legacy_run = lambda: legacy_decode(parsed, config_by_tags)  # noqa: E731
+        current_run = lambda: current_decode(parsed, config_by_tags, codecs)  # noqa: E731
+        runs = max(1, 20000 // len(parsed))
+        legacy = min(timeit.repeat(legacy_run, number=runs, repeat=5)) / runs
+        current = min(timeit.repeat(current_run, number=runs, repeat=5)) / runs
+        print(
+            f"{len(parsed):>5} tags: legacy {legacy * 1e6:8.1f} us "
+            f"{snapshot_memory(legacy_run) / 1024:7.1f} KiB | current {current * 1e6:8.1f} us "
+            f"{snapshot_memory(current_run) / 1024:7.1f} KiB ({legacy / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
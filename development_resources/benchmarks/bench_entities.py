@@ -0,0 +1,214 @@
+"""Entity setup and climate state writes, per platform filters vs entity plan.
+
+Startup: the previous platforms each walked the whole snapshot with their own
+type/adjustable/EXCLUDED_IDS filter (four walks), now plan_entities() assigns
+all tags in one pass. Timed on the snapshot read from the stand-in and on
+5,000 synthetic tags, and the platforms set up per circuit layout are listed.
+
+State writes: OrcaClimate needs Home Assistant, so the values read by a state
+write (current/target temperatures, hvac_mode, hvac_action) are mirrored here,
+once building "<id>_<circuit>" keys on every read as before, once with the
+precomputed ClimateKeys.
+
+Usage: python development_resources/benchmarks/bench_entities.py
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+models = load("models")
+const = load("const")
+entity_plan = load("entity_plan")
+
+ROUNDS = 200
+STATE_WRITES = 100_000
+
+
+def legacy_plan(data: dict, available_circuits: list[int]) -> list:
+    """Previous per platform filters, in setup order."""
+    excluded = const.EXCLUDED_IDS
+    filters = (
+        lambda c: c.type == "boolean" and not c.adjustable.enabled,
+        lambda c: c.type == "float" and c.adjustable.enabled,
+        lambda c: c.type in ["float", "multimode"] and not c.adjustable.enabled,
+        lambda c: c.type == "boolean" and c.adjustable.enabled,
+    )
+    planned = [
+        [
+            unique_id
+            for unique_id, tag_value in data.items()
+            if accept(tag_value.config) and tag_value.config.id not in excluded
+        ]
+        for accept in filters
+    ]
+    planned.append([c for c in available_circuits if c in [1, 2]])
+    planned.append(["wh_temp_top"] if 4 in available_circuits else [])
+    return planned
+
+
+def synthetic_snapshot(count: int) -> dict:
+    kinds = (
+        ("float", False),
+        ("float", True),
+        ("boolean", False),
+        ("boolean", True),
+        ("multimode", False),
+    )
+    data = {}
+    for i in range(count):
+        type_, adjustable = kinds[i % len(kinds)]
+        extra = {"unit": "°C"} if type_ == "float" else {}
+        config = models.FloatSensor if type_ == "float" else (
+            models.BooleanSensor if type_ == "boolean" else models.MultimodeSensor
+        )
+        tag = f"2_Bench_{i}"
+        data[tag] = orca_api.OrcaTagValue(
+            tag,
+            0,
+            config(
+                tag=tag,
+                id=tag,
+                unique_id=tag,
+                name={"en": tag, "si": tag},
+                heating_circuit=0,
+                adjustable={"enabled": adjustable},
+                type=type_,
+                **extra,
+            ),
+        )
+    return data
+
+
+def best_of(func) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+class LegacyClimateState:
+    """Previous OrcaClimate reads, unique IDs built per property read."""
+
+    def __init__(self, data: dict, circuit_id: int) -> None:
+        self.data = data
+        self._circuit_id = circuit_id
+
+    def _get_value(self, id_: str, convert_to_unique: bool = True) -> Any:
+        if convert_to_unique:
+            id_ = self._get_unique_id(id_)
+        if id_ in self.data:
+            return self.data[id_].value
+        return None
+
+    def _get_unique_id(self, id_: str) -> str:
+        return f"{id_}_{self._circuit_id}"
+
+    def state(self) -> tuple:
+        single = self._get_value("timer_programme") == "24h"
+        valve = self._get_value("valve_pos", convert_to_unique=False)
+        pump = self._get_value("hc_pump_status")
+        return (
+            self._get_value("hc_room_temp"),
+            self._get_value("hc_desired_day_temp") if single else None,
+            None if self._get_value("timer_programme") == "24h"
+            else self._get_value("hc_desired_day_temp"),
+            None if self._get_value("timer_programme") == "24h"
+            else self._get_value("hc_desired_night_temp"),
+            self._get_value("hc_turned_on") and self._get_value("hc_mode"),
+            valve == "room_heating"
+            and pump
+            and self._get_value("current_state", convert_to_unique=False),
+        )
+
+
+class PlannedClimateState:
+    """Current OrcaClimate reads with precomputed ClimateKeys."""
+
+    def __init__(self, data: dict, keys) -> None:
+        self.data = data
+        self._keys = keys
+
+    def _get_value(self, unique_id: str) -> Any:
+        if (tag_value := self.data.get(unique_id)) is not None:
+            return tag_value.value
+        return None
+
+    def state(self) -> tuple:
+        keys = self._keys
+        single = self._get_value(keys.timer_programme) == "24h"
+        valve = self._get_value("valve_pos")
+        pump = self._get_value(keys.pump_status)
+        return (
+            self._get_value(keys.room_temp),
+            self._get_value(keys.desired_day_temp) if single else None,
+            None if self._get_value(keys.timer_programme) == "24h"
+            else self._get_value(keys.desired_day_temp),
+            None if self._get_value(keys.timer_programme) == "24h"
+            else self._get_value(keys.desired_night_temp),
+            self._get_value(keys.turned_on) and self._get_value(keys.mode),
+            valve == "room_heating" and pump and self._get_value("current_state"),
+        )
+
+
+def per_write_ns(climate) -> float:
+    state = climate.state
+    start = time.perf_counter()
+    for _ in range(STATE_WRITES):
+        state()
+    return (time.perf_counter() - start) / STATE_WRITES * 1e9
+
+
+async def main() -> None:
+    server = StandIn()
+    await server.start()
+    try:
+        async with orca_api.OrcaApi(
+            "admin", "admin", server.host, config_path=CONFIG_PATH
+        ) as api:
+            await api.initialize()
+            data = {v.config.unique_id: v for v in await api.fetch_all()}
+            circuits = api.available_circuits
+    finally:
+        await server.stop()
+
+    print("entity setup, best of", ROUNDS)
+    for label, snapshot in (
+        (f"{len(data)} tags", data),
+        ("5000 tags", synthetic_snapshot(5000)),
+    ):
+        configs = [tag_value.config for tag_value in snapshot.values()]
+        legacy = best_of(lambda: legacy_plan(snapshot, circuits))
+        planned = best_of(lambda: entity_plan.plan_entities(configs, circuits))
+        print(
+            f"  {label:<10} per platform filters {legacy:8.1f} us  "
+            f"plan {planned:8.1f} us  {legacy / planned:4.1f}x"
+        )
+
+    print("platforms set up (of 6)")
+    for layout in ([0, 1, 2, 4], [0, 1], [0, 4], [0]):
+        configs = [
+            tag_value.config
+            for tag_value in data.values()
+            if tag_value.config.heating_circuit in layout
+        ]
+        platforms = entity_plan.plan_entities(configs, layout).platforms
+        print(f"  circuits {str(layout):<13} {len(platforms)}: {', '.join(platforms)}")
+
+    keys = entity_plan.ClimateKeys.for_circuit(1)
+    legacy = per_write_ns(LegacyClimateState(data, 1))
+    planned = per_write_ns(PlannedClimateState(data, keys))
+    print(
+        f"climate state write, {STATE_WRITES} writes: keys built per read "
+        f"{legacy:6.0f} ns  precomputed {planned:6.0f} ns  {legacy / planned:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
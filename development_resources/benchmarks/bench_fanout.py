@@ -0,0 +1,74 @@
+"""Poll latency for 1, 2, 4 and 8 readTags batches, sequential vs concurrent.
+
+The stand-in answers every request after a fixed delay, like the embedded web
+server does. max_connections=1 reproduces the previous one-batch-at-a-time poll.
+
+Usage: python development_resources/benchmarks/bench_fanout.py [delay_ms]
+"""
+
+import asyncio
+import sys
+import time
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+models = load("models")
+
+BATCH_SIZE = 150
+ROUNDS = 5
+
+
+def synthetic_tags(api, count: int) -> list[str]:
+    """Registers float tags on both client and stand-in, returns their names."""
+    tags = [f"2_Bench_Temp_{i}" for i in range(count)]
+    for tag in tags:
+        config = api._config_by_tags[tag] = models.FloatSensor(
+            tag=tag,
+            id=tag,
+            unique_id=tag,
+            name={"en": tag, "si": tag},
+            heating_circuit=0,
+            adjustable={"enabled": False},
+            type="float",
+            unit="°C",
+        )
+        api._codecs[tag] = orca_api._compile_codec(config)
+    return tags
+
+
+async def measure(server: StandIn, batches: int, max_connections: int) -> float:
+    async with orca_api.OrcaApi(
+        "admin",
+        "admin",
+        server.host,
+        config_path=CONFIG_PATH,
+        max_connections=max_connections,
+        cache_ttl=0,
+    ) as api:
+        await api.initialize()
+        tags = synthetic_tags(api, batches * BATCH_SIZE)
+        server.values.update({tag: "215" for tag in tags})
+        await api._get_bulk_values(tags)  # warm up connections
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            await api._get_bulk_values(tags)
+        return (time.perf_counter() - start) / ROUNDS
+
+
+async def main(delay_ms: float) -> None:
+    server = StandIn(latency=delay_ms / 1000)
+    await server.start()
+    try:
+        print(f"per-request delay {delay_ms} ms, {BATCH_SIZE} tags per batch")
+        print(f"{'batches':>7} {'limit=1':>10} {'limit=2':>10} {'limit=4':>10} {'limit=8':>10}")
+        for batches in (1, 2, 4, 8):
+            row = [await measure(server, batches, limit) for limit in (1, 2, 4, 8)]
+            print(f"{batches:>7} " + " ".join(f"{t * 1000:>7.1f} ms" for t in row))
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,270 @@
+"""Microbenchmarks of the poll path with JSON output for comparing versions.
+
+Covers URI building and cached request plans, response parsing, value decoding, write encoding,
+circuit filtering/renaming and the coordinator's snapshot merge at the size of
+config.yml (69 tags) and with 500 and 5,000 synthetic tags, plus an end-to-end
+fetch_all() against the local simulator. Synthetic tags are copies of the
+config.yml entries, so the mix of types stays realistic.
+
+The coordinator merge needs Home Assistant and is skipped without it.
+
+Usage: python development_resources/benchmarks/bench_hotpath.py
+           [--json results.json] [--compare previous.json] [--quick]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable, Coroutine
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+from orca_loader import CONFIG_PATH, PACKAGE_DIR, load
+from stand_in import StandIn, seed_values
+
+orca_api = load("orca_api")
+models = load("models")
+
+SIZES = (None, 500, 5000)  # None is config.yml as is
+
+
+# reads are sent from tasks of the API, so the cases need a running loop
+_LOOP = asyncio.new_event_loop()
+
+
+def run_sync(coro: Coroutine):
+    """Runs a coroutine that does no I/O to completion on the benchmark loop."""
+    return _LOOP.run_until_complete(coro)
+
+
+def synthetic_configs(base: list, count: int | None) -> list:
+    """Returns count configs cycling through base with unique tags and ids."""
+    if count is None:
+        return list(base)
+    configs = []
+    for i in range(count):
+        config = base[i % len(base)]
+        suffix = f"_{i // len(base)}" if i >= len(base) else ""
+        configs.append(
+            config.model_copy(update={"tag": config.tag + suffix, "id": config.id + suffix})
+        )
+    return configs
+
+
+def raw_values(base: list, configs: list) -> dict[str, str]:
+    """Simulator seed value of the config.yml entry each config was copied from."""
+    seeds = seed_values()
+    return {
+        config.tag: seeds[base[i % len(base)].tag] for i, config in enumerate(configs)
+    }
+
+
+def sample_write_value(config):
+    if isinstance(config, models.FloatSensor):
+        return config.adjustable.range.min
+    if isinstance(config, models.BooleanSensor):
+        return True
+    if isinstance(config, models.MultimodeSensor) and config.value_map:
+        return next(iter(config.value_map.values()))
+    return "0"
+
+
+def render(raw: dict[str, str]) -> bytes:
+    """Renders raw values as a readTags response body."""
+    return "".join(f"#{tag}\tS_OK\n192\t{value}\n" for tag, value in raw.items()).encode()
+
+
+def make_api(raw_configs: list, raw: dict[str, str]):
+    """Returns an API client with the layout of raw_configs that reads raw locally."""
+    api = orca_api.OrcaApi(
+        "admin", "admin", "127.0.0.1", config_path=CONFIG_PATH, cache_ttl=0
+    )
+    api._codecs.update({s.tag: orca_api._compile_codec(s) for s in raw_configs})
+
+    async def read_batches(uris):
+        return dict(raw)
+
+    api._read_batches = read_batches
+    # circuit probing only reads a few tags, not the whole response
+    values = {v.tag: v for v in run_sync(api._get_bulk_values(list(raw), {
+        s.tag: s for s in raw_configs
+    }))}
+
+    async def probe(tags, config_by_tags=None):
+        return [values[tag] for tag in tags if tag in values]
+
+    api._get_bulk_values = probe
+    api.set_layout(*run_sync(api._filter_and_rename_circuits(raw_configs)))
+    del api._get_bulk_values
+    # afterwards the device answers polls of the discovered layout
+    layout_raw = {s.tag: raw[s.tag] for s in api.tag_configs}
+
+    async def read_layout_batches(uris):
+        return dict(layout_raw)
+
+    api._read_batches = read_layout_batches
+    return api, probe
+
+
+def coordinator_case(api, values: list) -> Callable[[], object] | None:
+    """Returns the snapshot merge of _async_update_data, None without Home Assistant."""
+    try:
+        coordinator_module = load("coordinator")
+    except ImportError:
+        return None
+
+    class Store:
+        async def async_save(self, data):
+            pass
+
+    by_tag = {v.tag: v for v in values}
+    coordinator = object.__new__(coordinator_module.OrcaDataUpdateCoordinator)
+    coordinator.api = api
+    coordinator.data = {}
+    coordinator.last_update_success = True
+    coordinator._next_poll = {}
+    coordinator._store = Store()
+    coordinator._last_saved = time.monotonic()
+    coordinator._changed_ids = None
+
+    async def fetch_by_tags(tags):
+        return by_tag
+
+    api.fetch_by_tags = fetch_by_tags
+
+    def merge():
+        coordinator._next_poll.clear()  # every tag due, as on a full poll
+        coordinator.data = run_sync(coordinator._async_update_data())
+
+    return merge
+
+
+def cases(base: list, count: int | None) -> dict[str, Callable[[], object] | None]:
+    raw_configs = synthetic_configs(base, count)
+    raw = raw_values(base, raw_configs)
+    api, probe = make_api(raw_configs, raw)
+    tags = [s.tag for s in api.tag_configs]
+    body = render({tag: raw[tag] for tag in tags})
+    probe_api, _ = make_api(raw_configs, raw)
+    probe_api._get_bulk_values = probe
+    codecs = api._codecs
+    writes = {
+        s.tag: sample_write_value(s) for s in api.tag_configs if s.adjustable.enabled
+    }
+    values = run_sync(api._get_bulk_values(tags))
+
+    return {
+        "build_uris": lambda: api.request_planner.build(tags, orca_api.DEFAULT_BATCH_SIZE),
+        "plan_uris_cached": lambda: api.request_planner.plan(tags),
+        "parse_response": lambda: api._parse_response(body, {}),
+        "decode": lambda: run_sync(api._get_bulk_values(tags)),
+        "encode": lambda: [codecs[tag].encode(value) for tag, value in writes.items()],
+        "filter_and_rename_circuits": lambda: run_sync(
+            probe_api._filter_and_rename_circuits(raw_configs)
+        ),
+        "coordinator_merge": coordinator_case(api, values),
+    }
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    times = [t / loops for t in timer.repeat(repeat, loops)]
+    return {
+        "loops": loops,
+        "min_us": min(times) * 1e6,
+        "median_us": statistics.median(times) * 1e6,
+    }
+
+
+async def end_to_end(layout, raw: dict[str, str], polls: int) -> dict[str, float]:
+    """Polls the layout of the make_api() client from the simulator serving raw."""
+    server = StandIn()
+    server.values.update(raw)
+    await server.start()
+    try:
+        async with orca_api.OrcaApi(
+            "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+        ) as api:
+            api._codecs = layout._codecs
+            api.set_layout(layout.available_circuits, layout.tag_configs)
+            await api.fetch_all()  # login and warm up connections
+            times = []
+            for _ in range(polls):
+                start = time.perf_counter()
+                await api.fetch_all()
+                times.append(time.perf_counter() - start)
+    finally:
+        await server.stop()
+    return {
+        "loops": polls,
+        "min_us": min(times) * 1e6,
+        "median_us": statistics.median(times) * 1e6,
+    }
+
+
+def metadata() -> dict[str, str]:
+    manifest = json.loads((PACKAGE_DIR / "manifest.json").read_text(encoding="utf8"))
+    return {
+        "version": manifest.get("version", ""),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results: list[dict], previous_path: str) -> None:
+    with open(previous_path, encoding="utf8") as file:
+        previous = {(r["name"], r["tags"]): r for r in json.load(file)["results"]}
+    print(f"\ncompared to {previous_path} (median, >1 is slower)")
+    for result in results:
+        if (old := previous.get((result["name"], result["tags"]))) is not None:
+            ratio = result["median_us"] / old["median_us"]
+            print(f"{result['name']:<28} {result['tags']:>6} {ratio:6.2f}x")
+
+
+def main(args: argparse.Namespace) -> None:
+    repeat = 3 if args.quick else 7
+    polls = 5 if args.quick else 30
+    base = asyncio.run(
+        orca_api.OrcaApi("", "", "", config_path=CONFIG_PATH)._load_config()
+    )
+    results = []
+    print(f"{'case':<28} {'tags':>6} {'min':>12} {'median':>12}")
+    for count in SIZES:
+        size = count or len(base)
+        for name, func in cases(base, count).items():
+            if func is None:
+                print(f"{name:<28} {size:>6} {'skipped (Home Assistant not installed)':>25}")
+                continue
+            results.append({"name": name, "tags": size, **measure(func, repeat)})
+        raw_configs = synthetic_configs(base, count)
+        raw = raw_values(base, raw_configs)
+        layout, _ = make_api(raw_configs, raw)
+        results.append(
+            {"name": "fetch_all", "tags": size, **run_sync(end_to_end(layout, raw, polls))}
+        )
+        for result in results:
+            if result["tags"] == size:
+                print(
+                    f"{result['name']:<28} {size:>6} "
+                    f"{result['min_us']:>9.1f} us {result['median_us']:>9.1f} us"
+                )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf8") as file:
+            json.dump({"meta": metadata(), "results": results}, file, indent=2)
+        print(f"\nwritten to {args.json}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="results file of a previous run")
+    parser.add_argument("--quick", action="store_true", help="fewer repetitions")
+    main(parser.parse_args(sys.argv[1:]))
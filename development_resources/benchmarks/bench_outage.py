@@ -0,0 +1,154 @@
+"""Polls and writes while the heat pump stops answering, and the recovery.
+
+The stand-in stalls for OUTAGE seconds: connections are accepted but never
+answered, as when the device drops off Wi-Fi mid-session. A poll is started
+every POLL_EVERY seconds and a write attempted between polls. "fixed" is the
+previous client: a 10 s timeout per request and no circuit breaker. Breaker
+delays are scaled down (2 s doubling to 8 s instead of 30 s to 300 s) so the
+run takes about a minute.
+
+Then the device gets slower instead: latency rises from SLOW_FROM to SLOW_TO
+seconds, above the adaptive timeout learned at SLOW_FROM. The breaker must stay
+closed, the timeout widens after the first timeouts and the polls succeed again.
+
+Usage: python development_resources/benchmarks/bench_outage.py
+"""
+
+import asyncio
+import statistics
+import time
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+
+POLL_EVERY = 2.0
+OUTAGE = 20.0
+SLOW_FROM = 0.2
+SLOW_TO = 3.0
+SLOW_POLLS = 15
+
+
+class FixedTimeoutApi(orca_api.OrcaApi):
+    """Previous behaviour: fixed 10 s timeout, every request goes out."""
+
+    @property
+    def request_timeout(self) -> float:
+        return orca_api.MAX_REQUEST_TIMEOUT
+
+
+def breaker(fixed: bool):
+    if fixed:
+        return orca_api.CircuitBreaker(failure_threshold=10**9)
+    return orca_api.CircuitBreaker(base_delay=2.0, max_delay=8.0)
+
+
+async def run(server: StandIn, fixed: bool) -> str:
+    api_cls = FixedTimeoutApi if fixed else orca_api.OrcaApi
+    async with api_cls(
+        "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+    ) as api:
+        api.circuit_breaker = breaker(fixed)
+        await api.initialize()
+        setpoint = next(
+            config for config in api.tag_configs
+            if config.adjustable.enabled and config.type == "float"
+        )
+        for _ in range(20):
+            await api.fetch_all()
+
+        poll_times: list[float] = []
+        write_times: list[float] = []
+        recovered_at: float | None = None
+        tasks = set()
+
+        async def poll(started: float) -> None:
+            nonlocal recovered_at
+            try:
+                await api.fetch_all()
+            except (ConnectionError, TimeoutError):
+                poll_times.append(time.perf_counter() - started)
+            else:
+                if recovered_at is None and not server.stalled:
+                    recovered_at = time.perf_counter()
+
+        async def write() -> None:
+            started = time.perf_counter()
+            try:
+                await api.set_values({setpoint.tag: 21})
+            except (ConnectionError, TimeoutError):
+                write_times.append(time.perf_counter() - started)
+
+        server.reset_counters()
+        server.stalled = True
+        outage_start = time.perf_counter()
+        end = outage_start + OUTAGE + 30
+        while time.perf_counter() < end and recovered_at is None:
+            if server.stalled and time.perf_counter() - outage_start >= OUTAGE:
+                server.stalled = False
+                outage_end = time.perf_counter()
+                requests_in_outage = server.requests
+            tasks.add(asyncio.create_task(poll(time.perf_counter())))
+            await asyncio.sleep(POLL_EVERY / 2)
+            tasks.add(asyncio.create_task(write()))
+            await asyncio.sleep(POLL_EVERY / 2)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    recovery = recovered_at - outage_end if recovered_at else float("nan")
+    return (
+        f"{'fixed' if fixed else 'breaker':<8} failed poll p50 "
+        f"{statistics.median(poll_times):5.2f} s, failed write p50 "
+        f"{statistics.median(write_times):5.2f} s, {requests_in_outage} requests in outage, "
+        f"recovered {recovery:4.1f} s after the device"
+    )
+
+
+async def slow_device() -> str:
+    server = StandIn(latency=SLOW_FROM)
+    await server.start()
+    try:
+        async with orca_api.OrcaApi(
+            "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+        ) as api:
+            api.circuit_breaker = breaker(fixed=False)
+            await api.initialize()
+            for _ in range(20):
+                await api.fetch_all()
+            learned = api.request_timeout
+
+            server.latency = SLOW_TO
+            failed = 0
+            for _ in range(SLOW_POLLS):
+                try:
+                    await api.fetch_all()
+                except (ConnectionError, TimeoutError):
+                    failed += 1
+            opened = api.circuit_breaker.opened
+            assert opened == 0, f"breaker opened {opened} times"
+            assert failed < SLOW_POLLS, "no poll succeeded at the higher latency"
+            return (
+                f"timeout {learned:4.1f} s -> {api.request_timeout:4.1f} s, "
+                f"{failed} of {SLOW_POLLS} polls failed, breaker never opened"
+            )
+    finally:
+        await server.stop()
+
+
+async def main() -> None:
+    server = StandIn(latency=0.05)
+    await server.start()
+    try:
+        print(f"device stalls for {OUTAGE:.0f} s, poll every {POLL_EVERY:.0f} s")
+        for fixed in (True, False):
+            print(await run(server, fixed))
+    finally:
+        await server.stop()
+    print(f"device latency rises from {SLOW_FROM} s to {SLOW_TO} s")
+    print(await slow_device())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""Differential check and microbenchmark of the readTags response parser.
+
+Recorded dumps from development_resources are rendered into the heat pump wire
+format and parsed by both the previous str based parser and the current one;
+results must be identical. Then both are timed on 150 and 1,500 tag responses.
+
+Usage: python development_resources/benchmarks/bench_parser.py
+"""
+
+from pathlib import Path
+import timeit
+import tracemalloc
+
+from orca_loader import load
+
+orca_api = load("orca_api")
+
+DUMPS = sorted(Path(__file__).resolve().parents[1].glob("field_dump_*.txt"))
+
+
+def legacy_parse_response(raw_data: str) -> dict[str, str]:
+    """Parser as it was before switching to bytes."""
+    results = {}
+    entries = raw_data.strip().split("#")
+
+    for entry in entries:
+        clean_entry = entry.replace("\t", ";").replace("\n", ";")
+        parts = clean_entry.split(";")
+
+        if len(parts) < 4:
+            continue
+
+        tag_name = parts[0]
+        status = parts[1]
+        val = parts[3]
+
+        if status != "S_OK":
+            continue
+
+        results[tag_name] = val
+
+    return results
+
+
+def parse_response(raw_data: bytes) -> dict[str, str]:
+    results = {}
+    orca_api.OrcaApi._parse_response(None, raw_data, results)
+    return results
+
+
+def peak_memory(func, *args) -> int:
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def render(pairs: list[tuple[str, str]]) -> str:
+    """Renders (tag, value) pairs as a readTags response body."""
+    return "".join(f"#{tag}\tS_OK\n192\t{value}\n" for tag, value in pairs)
+
+
+def read_dump(path: Path) -> list[tuple[str, str]]:
+    pairs = []
+    for line in path.read_text(encoding="utf8").splitlines():
+        tag, sep, value = line.partition(": ")
+        if sep:
+            pairs.append((tag, value))
+    return pairs
+
+
+EDGE_CASES = [
+    "",
+    "#E_NEED_LOGIN\n",
+    "#2_Poti1\tE_UNKNOWNTAG\n#2_Poti2\tS_OK\n192\t207\n",
+    "#2_Poti1\tS_OK\n192\n#2_Poti2\tS_OK\n192\t-9999\n",
+    "#2_Poti1;S_OK;192;255;extra\n#2_Poti2\tS_OK\n192\t207\t\n",
+    "#2_Poti1\tS_OK\n192\t255\n#2_Poti1\tS_OK\n192\t256\n",
+    "2_Poti1\tS_OK\n192\t255\n#MK1_IME(2)\tS_OK\n192\t15",
+    "#2_Poti1\tS_OK\r\n192\t255\r\n",
+]
+
+
+def differential() -> int:
+    cases = [render(read_dump(path)) for path in DUMPS] + EDGE_CASES
+    for body in cases:
+        expected = legacy_parse_response(body)
+        actual = parse_response(body.encode())
+        assert actual == expected, (body[:200], expected, actual)
+    return len(cases)
+
+
+def main() -> None:
+    checked = differential()
+    print(f"differential: {checked} responses identical ({len(DUMPS)} recorded dumps)")
+
+    pairs = [pair for path in DUMPS for pair in read_dump(path)]
+    for size in (150, 1500):
+        body = render((pairs * (size // len(pairs) + 1))[:size])
+        raw = body.encode()
+        runs = 2000 if size == 150 else 200
+        legacy_run = lambda: legacy_parse_response(raw.decode())  # noqa: E731
+        current_run = lambda: parse_response(raw)  # noqa: E731
+        legacy = min(timeit.repeat(legacy_run, number=runs, repeat=7)) / runs
+        current = min(timeit.repeat(current_run, number=runs, repeat=7)) / runs
+        print(
+            f"{size:>5} tags: legacy {legacy * 1e6:7.1f} us {peak_memory(legacy_run) / 1024:6.1f} KiB | "
+            f"current {current * 1e6:7.1f} us {peak_memory(current_run) / 1024:6.1f} KiB "
+            f"({legacy / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Adaptive readTags batch size vs the fixed 150 tags per request.
+
+The simulator answers after a fixed delay plus a delay per tag and rejects
+requests with more than MAX_TAGS tags, like firmware with a smaller buffer
+would. The adaptive planner has to find the fastest size it tolerates.
+
+Usage: python development_resources/benchmarks/bench_planner.py [polls]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+models = load("models")
+
+TAGS = 1000
+MAX_TAGS = 220
+
+
+class FixedPlanner(orca_api.RequestPlanner):
+    """Previous behaviour: always 150 tags per request."""
+
+    def record(self, tags: int, seconds: float) -> None:
+        pass
+
+    def record_error(self, tags: int) -> None:
+        pass
+
+
+def synthetic_tags(api, count: int) -> list[str]:
+    """Registers float tags on the client, returns their names."""
+    tags = [f"2_Bench_Temp_{i}" for i in range(count)]
+    for tag in tags:
+        config = api._config_by_tags[tag] = models.FloatSensor(
+            tag=tag,
+            id=tag,
+            unique_id=tag,
+            name={"en": tag, "si": tag},
+            heating_circuit=0,
+            adjustable={"enabled": False},
+            type="float",
+            unit="°C",
+        )
+        api._codecs[tag] = orca_api._compile_codec(config)
+    return tags
+
+
+async def run(server: StandIn, planner, polls: int) -> tuple[list[float], list[int], int]:
+    async with orca_api.OrcaApi(
+        "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+    ) as api:
+        api.request_planner = planner
+        await api.initialize()
+        tags = synthetic_tags(api, TAGS)
+        server.values.update({tag: "215" for tag in tags})
+        times, sizes, failures = [], [], 0
+        for _ in range(polls):
+            sizes.append(planner.batch_size)
+            start = time.perf_counter()
+            try:
+                await api._get_bulk_values(tags)
+            except RuntimeError:
+                failures += 1
+                continue
+            times.append(time.perf_counter() - start)
+    return times, sizes, failures
+
+
+async def main(polls: int) -> None:
+    server = StandIn(latency=0.02, tag_latency=0.0001, max_tags=MAX_TAGS)
+    await server.start()
+    try:
+        print(f"{TAGS} tags, 20 ms + 0.1 ms per tag, at most {MAX_TAGS} tags per request")
+        for label, planner in (
+            ("fixed 150", FixedPlanner()),
+            ("adaptive", orca_api.RequestPlanner()),
+        ):
+            times, sizes, failures = await run(server, planner, polls)
+            tail = times[len(times) // 2 :]
+            print(
+                f"{label:<10} median poll {statistics.median(times) * 1000:6.1f} ms, "
+                f"second half {statistics.median(tail) * 1000:6.1f} ms, "
+                f"failed polls {failures}, final batch size {sizes[-1]}"
+            )
+            if label == "adaptive":
+                print(f"{'':<10} batch sizes: {' '.join(map(str, sizes[:40]))} ...")
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -0,0 +1,109 @@
+"""Write latency while the device is polled continuously, FIFO vs prioritized.
+
+The stand-in answers after 100 ms plus 0.2 ms per tag, the client keeps
+polling 1,500 tags (ten readTags batches on two connections) back to back and
+writes a setpoint every WRITE_EVERY seconds, reading it back like the
+coordinator does. With FIFO slots a write waits for the poll batches queued
+before it; with priorities it takes the next free connection.
+
+Usage: python development_resources/benchmarks/bench_priority.py [writes]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+models = load("models")
+
+TAGS = 1500
+WRITE_EVERY = 0.25
+
+
+class FifoScheduler(orca_api.RequestScheduler):
+    """Previous behaviour: one queue, first come first served."""
+
+    def slot(self, priority):
+        return super().slot(orca_api.RequestPriority.POLL)
+
+
+def synthetic_tags(api, count: int) -> list[str]:
+    """Registers float tags on the client, returns their names."""
+    tags = [f"2_Bench_Temp_{i}" for i in range(count)]
+    for tag in tags:
+        config = api._config_by_tags[tag] = models.FloatSensor(
+            tag=tag,
+            id=tag,
+            unique_id=tag,
+            name={"en": tag, "si": tag},
+            heating_circuit=0,
+            adjustable={"enabled": False},
+            type="float",
+            unit="°C",
+        )
+        api._codecs[tag] = orca_api._compile_codec(config)
+    return tags
+
+
+async def run(server: StandIn, scheduler, writes: int) -> tuple[list[float], list[float], int]:
+    async with orca_api.OrcaApi(
+        "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+    ) as api:
+        api.request_scheduler = scheduler
+        await api.initialize()
+        tags = synthetic_tags(api, TAGS)
+        server.values.update({tag: "215" for tag in tags})
+        setpoint = next(
+            config for config in api.tag_configs
+            if config.adjustable.enabled and config.type == "float"
+        )
+        polls = 0
+
+        async def poll() -> None:
+            nonlocal polls
+            while True:
+                await api.fetch_by_tags(tags)
+                polls += 1
+
+        poller = asyncio.create_task(poll())
+        write_times, confirm_times = [], []
+        await asyncio.sleep(0.3)
+        for i in range(writes):
+            start = time.perf_counter()
+            await api.set_values({setpoint.tag: 20 + i % 5})
+            write_times.append(time.perf_counter() - start)
+            with orca_api.request_priority(orca_api.RequestPriority.CONFIRM):
+                await api.fetch_by_tags([setpoint.tag])
+            confirm_times.append(time.perf_counter() - start)
+            await asyncio.sleep(WRITE_EVERY)
+        poller.cancel()
+    return write_times, confirm_times, polls
+
+
+async def main(writes: int) -> None:
+    server = StandIn(latency=0.1, tag_latency=0.0002)
+    await server.start()
+    try:
+        print(f"{TAGS} tags polled continuously, {writes} writes, 100 ms + 0.2 ms per tag")
+        for label, scheduler in (
+            ("fifo", FifoScheduler(orca_api.MAX_CONNECTIONS_PER_HOST)),
+            ("priority", orca_api.RequestScheduler(orca_api.MAX_CONNECTIONS_PER_HOST)),
+        ):
+            write_times, confirm_times, polls = await run(server, scheduler, writes)
+            waits = scheduler.as_dict()["priorities"]
+            print(
+                f"{label:<9} write p50 {statistics.median(write_times) * 1000:6.1f} ms "
+                f"max {max(write_times) * 1000:6.1f} ms, "
+                f"write+confirm p50 {statistics.median(confirm_times) * 1000:6.1f} ms, "
+                f"{polls} polls, poll queue max {waits['poll']['max_queue_depth']}"
+            )
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
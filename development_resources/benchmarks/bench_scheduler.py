@@ -0,0 +1,135 @@
+"""Polling 1, 5 and 20 heat pumps at once vs staggered by the PollScheduler.
+
+Every device is a stand-in on its own loopback address. All clients share one
+session whose connection pool is limited to POOL_LIMIT connections, like a
+small Home Assistant host on one network link. "burst" starts every poll at
+the same moment, as independent coordinators set up together do; "staggered"
+spreads them over the interval.
+
+Usage: python development_resources/benchmarks/bench_scheduler.py [interval_s] [cycles]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import aiohttp
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+scheduler = load("scheduler")
+
+DEVICES = (1, 5, 20)
+POOL_LIMIT = 8
+
+
+class Load:
+    """Requests in flight on the shared session and event loop lag."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.loop_lag: list[float] = []
+        self.trace = aiohttp.TraceConfig()
+        self.trace.on_request_start.append(self._start)
+        self.trace.on_request_end.append(self._end)
+        self.trace.on_request_exception.append(self._end)
+
+    async def _start(self, *args) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+
+    async def _end(self, *args) -> None:
+        self.in_flight -= 1
+
+    async def watch_loop(self, tick: float = 0.01) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            self.loop_lag.append(time.perf_counter() - start - tick)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(count: int, staggered: bool, interval: float, cycles: int) -> str:
+    servers = [
+        StandIn(latency=0.05, tag_latency=0.0002, address=f"127.0.0.{i + 2}")
+        for i in range(count)
+    ]
+    for server in servers:
+        await server.start()
+    load = Load()
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=POOL_LIMIT, limit_per_host=orca_api.MAX_CONNECTIONS_PER_HOST
+        ),
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        trace_configs=[load.trace],
+    )
+    apis = [
+        orca_api.OrcaApi(
+            "admin", "admin", server.host, config_path=CONFIG_PATH, session=session, cache_ttl=0
+        )
+        for server in servers
+    ]
+    durations: list[float] = []
+
+    async def poll(api) -> None:
+        start = time.perf_counter()
+        await api.fetch_all()
+        durations.append(time.perf_counter() - start)
+
+    try:
+        for api in apis:
+            await api.initialize()
+        watcher = asyncio.create_task(load.watch_loop())
+        if staggered:
+            polls = scheduler.PollScheduler(interval)
+            for i, api in enumerate(apis):
+                polls.add(str(i), lambda api=api: poll(api))
+            await asyncio.sleep(interval * cycles)
+            for i in range(count):
+                await polls.remove(str(i))
+        else:
+            for _ in range(cycles):
+                await asyncio.gather(*(poll(api) for api in apis), asyncio.sleep(interval))
+        watcher.cancel()
+        # let polls still in flight finish before the clients are closed
+        while load.in_flight:
+            await asyncio.sleep(0.01)
+        for api in apis:
+            await api.close()
+    finally:
+        await session.close()
+        for server in servers:
+            await server.stop()
+
+    return (
+        f"{count:>3} devices {'staggered' if staggered else 'burst':<10}"
+        f"peak requests {load.peak:3d}  "
+        f"poll p50 {statistics.median(durations) * 1000:6.1f} ms  "
+        f"p95 {percentile(durations, 0.95) * 1000:6.1f} ms  "
+        f"max loop lag {max(load.loop_lag) * 1000:5.1f} ms"
+    )
+
+
+async def main(interval: float, cycles: int) -> None:
+    print(f"interval {interval} s, {cycles} cycles, pool of {POOL_LIMIT} connections")
+    for count in DEVICES:
+        for staggered in (False, True):
+            print(await run(count, staggered, interval, cycles))
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            float(sys.argv[1]) if len(sys.argv) > 1 else 2.0,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+        )
+    )
@@ -0,0 +1,66 @@
+"""Connections and latency per poll: session per request vs pooled session.
+
+Usage: python development_resources/benchmarks/bench_session.py [polls]
+"""
+
+import asyncio
+import sys
+import time
+
+import aiohttp
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+
+
+class SessionPerRequestApi(orca_api.OrcaApi):
+    """Previous behaviour: a new ClientSession for every request."""
+
+    _legacy_token = None
+
+    async def _get(self, url: str) -> bytes:
+        cookies = {orca_api.TOKEN_COOKIE: self._legacy_token} if self._legacy_token else {}
+        timeout = aiohttp.ClientTimeout(total=orca_api.MAX_REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(cookies=cookies) as session:
+            async with session.get(url, timeout=timeout) as resp:
+                body = await resp.read()
+        if orca_api.TOKEN_COOKIE.encode() in body:
+            self._legacy_token = body.decode().split("=", 1)[1].strip()
+        return body
+
+
+async def run(api_cls, server: StandIn, polls: int) -> tuple[float, float, float]:
+    async with api_cls(
+        "admin", "admin", server.host, config_path=CONFIG_PATH, cache_ttl=0
+    ) as api:
+        await api.initialize()
+        await api.fetch_all()
+        server.reset_counters()
+        start = time.perf_counter()
+        for _ in range(polls):
+            await api.fetch_all()
+        elapsed = time.perf_counter() - start
+    return server.connections / polls, server.requests / polls, elapsed / polls
+
+
+async def main(polls: int) -> None:
+    server = StandIn(latency=0.002)
+    await server.start()
+    try:
+        for label, api_cls in (
+            ("session per request", SessionPerRequestApi),
+            ("pooled session", orca_api.OrcaApi),
+        ):
+            conns, reqs, latency = await run(api_cls, server, polls)
+            print(
+                f"{label:<20} connects/poll={conns:5.2f} "
+                f"requests/poll={reqs:5.2f} latency/poll={latency * 1000:7.2f} ms"
+            )
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,77 @@
+"""Cold vs warm startup: config loading and initialize() with the config cache.
+
+Cold runs parse config.yml and write the compiled cache, warm runs read the
+cache. The previous loader (pure Python safe_load and a new TypeAdapter per
+call) is timed for reference.
+
+Usage: python development_resources/benchmarks/bench_startup.py
+"""
+
+import asyncio
+from pathlib import Path
+import tempfile
+import time
+
+from pydantic import TypeAdapter
+import yaml
+
+from orca_loader import CONFIG_PATH, load
+from stand_in import StandIn
+
+orca_api = load("orca_api")
+models = load("models")
+
+ROUNDS = 20
+
+
+def legacy_load_config():
+    content = CONFIG_PATH.read_text(encoding="utf8")
+    yaml_data = [item for item in yaml.safe_load(content) or [] if "tag" in item]
+    return TypeAdapter(list[models.OrcaTagConfig]).validate_python(yaml_data)
+
+
+async def timed(func, cleanup=None) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        if cleanup:
+            cleanup()
+        start = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def main() -> None:
+    server = StandIn()
+    await server.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "orca.config_cache"
+        remove_cache = lambda: cache_path.unlink(missing_ok=True)  # noqa: E731
+
+        async def load_config():
+            api = orca_api.OrcaApi(
+                "admin", "admin", server.host, config_path=CONFIG_PATH, config_cache_path=cache_path
+            )
+            await api._load_config()
+
+        async def initialize():
+            async with orca_api.OrcaApi(
+                "admin", "admin", server.host, config_path=CONFIG_PATH, config_cache_path=cache_path
+            ) as api:
+                await api.initialize()
+
+        async def legacy():
+            legacy_load_config()
+
+        try:
+            print(f"_load_config  legacy {await timed(legacy):7.2f} ms")
+            print(f"_load_config  cold   {await timed(load_config, remove_cache):7.2f} ms")
+            print(f"_load_config  warm   {await timed(load_config):7.2f} ms")
+            print(f"initialize()  cold   {await timed(initialize, remove_cache):7.2f} ms")
+            print(f"initialize()  warm   {await timed(initialize):7.2f} ms")
+        finally:
+            await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
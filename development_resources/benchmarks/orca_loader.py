@@ -0,0 +1,22 @@
+"""Imports the integration's API client without Home Assistant.
+
+custom_components/orca/__init__.py imports homeassistant, so the package is
+registered here with only its path set and the submodules are imported directly.
+"""
+
+import importlib
+from pathlib import Path
+import sys
+import types
+
+PACKAGE_DIR = Path(__file__).resolve().parents[2] / "custom_components" / "orca"
+CONFIG_PATH = PACKAGE_DIR / "config.yml"
+
+
+def load(module: str = "orca_api"):
+    """Returns a submodule of the orca integration, e.g. load("orca_api")."""
+    if "orca" not in sys.modules:
+        package = types.ModuleType("orca")
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules["orca"] = package
+    return importlib.import_module(f"orca.{module}")
@@ -0,0 +1,311 @@
+"""Local simulator of the Orca CGI interface.
+
+Serves /cgi/login, /cgi/logout, /cgi/readTags and /cgi/writeTags in the heat
+pump wire format, so the client can be exercised and benchmarked without a
+device on the LAN. The simulator reproduces the device behaviour the client
+has to cope with:
+
+- per-request latency, optionally growing with the number of tags read,
+- a limit of tags per readTags request, answered with an error,
+- a limited number of logged in users (#E_TOO_MANY_USERS),
+- token expiry (#E_NEED_LOGIN),
+- tags that exist but have no value (-9999) and unknown tags (E_UNKNOWNTAG),
+- scripted value dynamics, evaluated on a clock the caller can control,
+- an unresponsive device (stalled), requests are accepted but never answered.
+
+Values are seeded from config.yml and optionally from recorded tag dumps
+(development_resources/field_dump_*.txt) or scans. The simulator also counts
+the TCP connections and requests it accepts.
+
+Usage as a standalone server (point the integration or test.py at it):
+
+    python development_resources/benchmarks/stand_in.py [--port 8080]
+        [--latency 0.05] [--max-users 2] [--token-ttl 600] [--dump FILE]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterable
+import gzip
+import json
+import math
+from pathlib import Path
+import secrets
+import time
+
+from aiohttp import web
+import yaml
+
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "custom_components/orca/config.yml"
+DUMPS = sorted(Path(__file__).resolve().parents[1].glob("field_dump_*.txt"))
+
+# reported by the device for tags that exist but have no sensor connected
+NO_VALUE = "-9999"
+
+# circuit detection tags are reported as present
+DEFAULT_VALUES = {
+    "2_Shema_MK1": "1",
+    "2_Shema_MK2": "1",
+    "2_Shema_SV": "1",
+    "MK1_IME": "11",
+    "MK1_IME(2)": "15",
+}
+
+# raw value of a tag as a function of the simulated time in seconds
+Dynamic = Callable[[float], str]
+
+
+def seed_values(
+    config_path: Path = CONFIG_PATH, dumps: Iterable[Path] = ()
+) -> dict[str, str]:
+    """Returns a valid raw value for every tag in config.yml.
+
+    Values recorded in the given dump files take precedence.
+    """
+    values = {}
+    for item in yaml.safe_load(config_path.read_text(encoding="utf8")):
+        if "tag" not in item:
+            continue  # derived metric
+        if item["type"] == "boolean":
+            values[item["tag"]] = "0"
+        elif item["type"] == "multimode":
+            values[item["tag"]] = str(next(iter(item.get("value_map") or {0: ""})))
+        else:
+            values[item["tag"]] = "215"
+    values |= DEFAULT_VALUES
+    for path in dumps:
+        values |= read_dump(path)
+    return values
+
+
+def read_dump(path: Path) -> dict[str, str]:
+    """Reads a "tag: value" dump or a scan written by dump_all/scan_tags.py."""
+    if path.suffix == ".gz":
+        with gzip.open(path, "rt", encoding="utf8") as file:
+            return {record["tag"]: record["value"] for record in map(json.loads, file)}
+    values = {}
+    for line in path.read_text(encoding="utf8").splitlines():
+        tag, sep, value = line.partition(": ")
+        if sep:
+            values[tag] = value.strip()
+    return values
+
+
+def sine(mean: float, amplitude: float, period: float) -> Dynamic:
+    """Raw value oscillating around mean, e.g. sine(215, 30, 600) for 21.5 °C ± 3."""
+    return lambda t: str(round(mean + amplitude * math.sin(2 * math.pi * t / period)))
+
+
+def ramp(start: float, step: float, every: float) -> Dynamic:
+    """Raw value changing by step every given number of seconds."""
+    return lambda t: str(round(start + step * (t // every)))
+
+
+def cycle(values: list[str], every: float) -> Dynamic:
+    """Raw value stepping through values, e.g. compressor cycling on and off."""
+    return lambda t: values[int(t // every) % len(values)]
+
+
+class StandIn:
+    """Orca simulator with connection and request counters.
+
+    tag_latency is added to latency for every tag read in one request.
+    max_tags, max_users and token_ttl are unlimited when None. Several stand-ins
+    can listen on distinct loopback addresses (127.0.0.2, ...) so their tokens
+    do not clash in one cookie jar. clock returns the
+    simulated time in seconds, it drives token expiry and value dynamics.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        keepalive: bool = True,
+        tag_latency: float = 0.0,
+        max_tags: int | None = None,
+        max_users: int | None = None,
+        token_ttl: float | None = None,
+        dumps: Iterable[Path] = (),
+        clock: Callable[[], float] = time.monotonic,
+        address: str = "127.0.0.1",
+    ) -> None:
+        self.address = address
+        self.latency = latency
+        self.tag_latency = tag_latency
+        self.max_tags = max_tags
+        self.keepalive = keepalive
+        self.max_users = max_users
+        self.token_ttl = token_ttl
+        self.clock = clock
+        self.values: dict[str, str] = seed_values(dumps=dumps)
+        self.dynamics: dict[str, Dynamic] = {}
+        # tags known to the device without a value
+        self.unavailable: set[str] = set()
+        # token -> time of login
+        self.tokens: dict[str, float] = {}
+        self._started = clock()
+        self.connections = 0
+        self.requests = 0
+        self.logins = 0
+        self.logouts = 0
+        self.rejected_logins = 0
+        # requests hang, like a device that dropped off the network mid-session
+        self.stalled = False
+        self._seen_peers: set[tuple[str, int]] = set()
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    @property
+    def host(self) -> str:
+        return f"{self.address}:{self.port}"
+
+    async def start(self, port: int = 0) -> None:
+        app = web.Application()
+        app.router.add_get("/cgi/login", self._login)
+        app.router.add_get("/cgi/logout", self._logout)
+        app.router.add_get("/cgi/readTags", self._read_tags)
+        app.router.add_get("/cgi/writeTags", self._write_tags)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.address, port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    def reset_counters(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self.logins = 0
+        self.logouts = 0
+        self.rejected_logins = 0
+        self._seen_peers.clear()
+
+    def script(self, tag: str, dynamic: Dynamic) -> None:
+        """Lets the value of tag follow dynamic until it is written."""
+        self.dynamics[tag] = dynamic
+
+    def expire_tokens(self) -> None:
+        """Invalidates all tokens, as a device reboot does."""
+        self.tokens.clear()
+
+    def value(self, tag: str) -> str | None:
+        """Current raw value of tag, None for tags unknown to the device."""
+        if tag in self.unavailable:
+            return NO_VALUE
+        if tag in self.dynamics:
+            return self.dynamics[tag](self.clock() - self._started)
+        return self.values.get(tag)
+
+    def _response(self, text: str) -> web.Response:
+        headers = {} if self.keepalive else {"Connection": "close"}
+        return web.Response(text=text, content_type="text/plain", headers=headers)
+
+    async def _delay(self, request: web.Request) -> None:
+        # every TCP connection comes from its own client port
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer not in self._seen_peers:
+            self._seen_peers.add(peer)
+            self.connections += 1
+        self.requests += 1
+        while self.stalled:
+            await asyncio.sleep(0.1)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _drop_expired(self) -> None:
+        if self.token_ttl is None:
+            return
+        now = self.clock()
+        for token, issued in list(self.tokens.items()):
+            if now - issued >= self.token_ttl:
+                del self.tokens[token]
+
+    def _authorized(self, request: web.Request) -> bool:
+        self._drop_expired()
+        return request.cookies.get("IDALToken") in self.tokens
+
+    async def _login(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        self._drop_expired()
+        if self.max_users is not None and len(self.tokens) >= self.max_users:
+            self.rejected_logins += 1
+            return self._response("#E_TOO_MANY_USERS\n")
+        token = secrets.token_hex(16)
+        self.tokens[token] = self.clock()
+        self.logins += 1
+        return self._response(f"#S_OK\nIDALToken={token}\n")
+
+    async def _logout(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if self.tokens.pop(request.cookies.get("IDALToken"), None) is not None:
+            self.logouts += 1
+        return self._response("#S_OK\n")
+
+    def _entry(self, tag: str, value: str | None) -> str:
+        if value is None:
+            return f"#{tag}\tE_UNKNOWNTAG\n"
+        return f"#{tag}\tS_OK\n192\t{value}\n"
+
+    async def _read_tags(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if not self._authorized(request):
+            return self._response("#E_NEED_LOGIN\n")
+        count = int(request.query.get("n", 0))
+        if self.max_tags is not None and count > self.max_tags:
+            return self._response("#E_TOO_MANY_TAGS\n")
+        if self.tag_latency:
+            await asyncio.sleep(self.tag_latency * count)
+        body = []
+        for i in range(1, count + 1):
+            tag = request.query.get(f"t{i}", "")
+            body.append(self._entry(tag, self.value(tag)))
+        return self._response("".join(body))
+
+    async def _write_tags(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if not self._authorized(request):
+            return self._response("#E_NEED_LOGIN\n")
+        count = int(request.query.get("n", 0))
+        body = []
+        for i in range(1, count + 1):
+            tag = request.query.get(f"t{i}", "")
+            if tag in self.values:
+                self.values[tag] = request.query.get(f"v{i}", "")
+                self.dynamics.pop(tag, None)
+                self.unavailable.discard(tag)
+            body.append(self._entry(tag, self.value(tag)))
+        return self._response("".join(body))
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = StandIn(
+        latency=args.latency,
+        max_users=args.max_users,
+        token_ttl=args.token_ttl,
+        dumps=args.dump,
+    )
+    # some movement for the dashboard
+    server.script("2_Temp_Zunanja", sine(50, 40, 3600))
+    server.script("2_Temp_Prostora", sine(215, 5, 900))
+    server.script("2_Vklop_C0", cycle(["1", "0"], 300))
+    await server.start(args.port)
+    print(f"Orca simulator listening on {server.host}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-users", type=int, default=2)
+    parser.add_argument("--token-ttl", type=float, default=600)
+    parser.add_argument("--dump", type=Path, action="append", default=[])
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
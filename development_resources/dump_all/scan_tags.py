@@ -0,0 +1,263 @@
+"""Scans an Orca heat pump for tags and streams what it finds to NDJSON.
+
+Candidate tag names come from wordlists (one name per line, "name:" and
+"name: value" lines work too), earlier dumps and scans, and config.yml. Every
+name is also tried with each known prefix, e.g. "Temp_Zunanja" found as
+"2_Temp_Zunanja" is tried as "MK1_Temp_Zunanja" as well. Candidates are read
+in readTags batches with bounded concurrency through the integration's
+OrcaApi; tags the device does not know are answered with E_UNKNOWNTAG and
+dropped.
+
+Found tags are appended to a gzip compressed NDJSON file, one
+{"tag": ..., "value": ..., "time": ...} record per line, value being the raw
+string ("-9999" for tags without a value). A checkpoint next to it records how
+far the scan got, running the same command again resumes there. A scan with
+other candidates does not overwrite an existing output without --force.
+
+Usage (from the repository root):
+
+    python development_resources/dump_all/scan_tags.py 192.168.1.100
+        [--wordlist FILE] [--dump FILE] [--prefix 2_] [--out scan.ndjson.gz]
+        [--concurrency 4] [--batch-size 150] [--no-expand] [--force]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Iterable, Iterator
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from orca_loader import CONFIG_PATH, load  # noqa: E402
+
+orca_api = load("orca_api")
+
+RESOURCES = Path(__file__).resolve().parents[1]
+DEFAULT_WORDLISTS = [RESOURCES / "all_fields.txt"]
+DEFAULT_DUMPS = sorted(RESOURCES.glob("field_dump_*.txt"))
+
+# device-wide tags start with "2_", circuit tags with the circuit, e.g. "MK1_"
+DEFAULT_PREFIXES = ("2_", "MK1_", "MK2_", "MK3_", "SV_")
+_PREFIX = re.compile(r"^(\d+_|MK\d+_|SV_)")
+_TAG_NAME = re.compile(r"^[A-Za-z0-9_().\-]+$")
+
+# records are flushed and the checkpoint written after this many batches
+CHECKPOINT_EVERY = 5
+
+
+def read_names(path: Path) -> Iterator[str]:
+    """Yields tag names from a wordlist, a raw or "tag: value" dump or a scan."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf8", errors="replace") as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith("{"):
+                name = json.loads(line).get("tag", "")
+            elif line.startswith("#"):
+                # raw readTags response: "#<tag>\tS_OK"
+                name = re.split(r"[\t;]", line[1:], maxsplit=1)[0]
+            else:
+                name = line.partition(":")[0].strip()
+            if _TAG_NAME.match(name) and not name.isdigit():
+                yield name
+
+
+def candidates(
+    names: Iterable[str], prefixes: Iterable[str], expand: bool = True
+) -> list[str]:
+    """Known names first, then every stem with every prefix, without duplicates."""
+    ordered = dict.fromkeys(names)
+    if expand:
+        prefixes = dict.fromkeys(prefixes)
+        stems = {}
+        for name in ordered:
+            if match := _PREFIX.match(name):
+                prefixes[match.group(1)] = None
+                stems[name[match.end() :]] = None
+        for stem in stems:
+            for prefix in prefixes:
+                ordered.setdefault(prefix + stem)
+    return list(ordered)
+
+
+class Checkpoint:
+    """Number of leading candidates already scanned, for one candidate list."""
+
+    def __init__(self, path: Path, names: list[str]) -> None:
+        self.path = path
+        # a checkpoint of another candidate list does not apply
+        self.key = hashlib.sha256("\n".join(names).encode()).hexdigest()
+        self.done = 0
+        if path.exists():
+            state = json.loads(path.read_text())
+            if state.get("candidates") == self.key:
+                self.done = state["done"]
+
+    def save(self, done: int) -> None:
+        self.done = done
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"candidates": self.key, "done": done}))
+        os.replace(temporary, self.path)
+
+
+def open_output(path: Path, resume: bool) -> tuple[gzip.GzipFile, set[str]]:
+    """Opens the NDJSON output, keeping complete records of an interrupted scan."""
+    records = []
+    if resume and path.exists():
+        try:
+            with gzip.open(path, "rt", encoding="utf8") as file:
+                for line in file:
+                    if line.endswith("\n"):
+                        records.append(line)
+        except (EOFError, gzip.BadGzipFile):
+            pass  # the scan was interrupted while writing, the tail is rescanned
+    output = gzip.open(path, "wt", encoding="utf8")
+    output.writelines(records)
+    return output, {json.loads(record)["tag"] for record in records}
+
+
+class Scanner:
+    """Reads candidate batches with a fixed number of workers."""
+
+    def __init__(self, api, batch_size: int, concurrency: int, output, found: set[str]):
+        self.api = api
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.output = output
+        self.found = found
+        self.failed: list[str] = []
+        self.requests = 0
+
+    async def read(self, tags: list[str]) -> dict[str, str]:
+        """Reads one batch, halving it while the device rejects it."""
+        self.requests += 1
+        try:
+            return await self.api.fetch_raw(tags, batch_size=len(tags))
+        except RuntimeError:
+            if len(tags) == 1:
+                self.failed.append(tags[0])
+                return {}
+            half = len(tags) // 2
+            return await self.read(tags[:half]) | await self.read(tags[half:])
+
+    async def run(self, names: list[str], checkpoint: Checkpoint) -> None:
+        batches = [
+            names[start : start + self.batch_size]
+            for start in range(checkpoint.done, len(names), self.batch_size)
+        ]
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(len(batches)):
+            queue.put_nowait(index)
+        completed: set[int] = set()
+        # batches finish out of order, the checkpoint covers the leading ones
+        resumed_at = checkpoint.done
+        contiguous = 0
+        started = time.monotonic()
+
+        async def worker() -> None:
+            nonlocal contiguous
+            while not queue.empty():
+                index = queue.get_nowait()
+                values = await self.read(batches[index])
+                now = round(time.time(), 1)
+                for tag in batches[index]:
+                    if tag in values and tag not in self.found:
+                        self.found.add(tag)
+                        record = {"tag": tag, "value": values[tag], "time": now}
+                        self.output.write(json.dumps(record) + "\n")
+                completed.add(index)
+                while contiguous in completed:
+                    contiguous += 1
+                if len(completed) % CHECKPOINT_EVERY == 0 or len(completed) == len(batches):
+                    self.output.flush()
+                    done = min(resumed_at + contiguous * self.batch_size, len(names))
+                    checkpoint.save(done)
+                    self.progress(done, len(names), time.monotonic() - started)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def progress(self, done: int, total: int, elapsed: float) -> None:
+        print(
+            f"\r{done}/{total} candidates, {len(self.found)} tags found, "
+            f"{self.requests / max(elapsed, 1e-9):.1f} requests/s",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+async def scan(args: argparse.Namespace) -> None:
+    names: list[str] = [config.tag for config in await load_config()]
+    for path in args.wordlist or DEFAULT_WORDLISTS:
+        names.extend(read_names(path))
+    for path in args.dump or DEFAULT_DUMPS:
+        names.extend(read_names(path))
+    names = candidates(names, DEFAULT_PREFIXES + tuple(args.prefix), not args.no_expand)
+
+    checkpoint = Checkpoint(args.out.with_name(args.out.name + ".checkpoint"), names)
+    resume = checkpoint.done > 0
+    if not resume and args.out.exists() and not args.force:
+        # the checkpoint is of other candidates (wordlists, dumps, prefixes)
+        raise SystemExit(
+            f"{args.out} holds another scan, choose a new --out or pass --force "
+            "to overwrite it"
+        )
+    output, found = open_output(args.out, resume)
+    print(
+        f"{len(names)} candidates, resuming at {checkpoint.done}" if checkpoint.done
+        else f"{len(names)} candidates",
+        file=sys.stderr,
+    )
+    started = time.monotonic()
+    try:
+        async with orca_api.OrcaApi(
+            args.user, args.password, args.host, max_connections=args.concurrency
+        ) as api:
+            scanner = Scanner(api, args.batch_size, args.concurrency, output, found)
+            await scanner.run(names, checkpoint)
+    finally:
+        output.close()
+    print(
+        f"\n{len(found)} tags in {args.out}, {time.monotonic() - started:.1f} s",
+        file=sys.stderr,
+    )
+    if scanner.failed:
+        print(f"Rejected by the device: {', '.join(scanner.failed)}", file=sys.stderr)
+
+
+async def load_config():
+    """Tags of the integration's config.yml, they are always candidates."""
+    api = orca_api.OrcaApi("", "", "", config_path=CONFIG_PATH)
+    return await api._load_config()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("host", help="IP address of the heat pump, optionally with :port")
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument(
+        "--wordlist", type=Path, action="append", help="default: all_fields.txt"
+    )
+    parser.add_argument(
+        "--dump", type=Path, action="append", help="default: field_dump_*.txt"
+    )
+    parser.add_argument("--prefix", action="append", default=[])
+    parser.add_argument("--no-expand", action="store_true", help="do not combine prefixes")
+    parser.add_argument("--out", type=Path, default=Path("scan.ndjson.gz"))
+    parser.add_argument(
+        "--force", action="store_true", help="overwrite --out if it holds another scan"
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=orca_api.DEFAULT_BATCH_SIZE)
+    asyncio.run(scan(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
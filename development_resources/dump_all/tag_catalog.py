@@ -0,0 +1,369 @@
+"""Catalog of tags in dumps and scans, and config.yml entries for new ones.
+
+Every input file is one snapshot of a device: a raw readTags dump
+("#<tag>\tS_OK" followed by "<quality>\t<value>"), a "tag: value" dump such as
+development_resources/field_dump_*.txt, or a scan written by scan_tags.py
+(gzip NDJSON). Files are memory-mapped and parsed line by line, so memory
+grows with the number of distinct tags, not with the size of the dumps.
+
+For every tag the catalog keeps the observed values (up to MAX_DISTINCT
+distinct ones), their range, how often the value changed from one snapshot to
+the next (volatility) and a guess of its type:
+
+- boolean: only 0 and 1 seen
+- float: value in tenths (215 is 21.5), the name suggests a measurement or
+  the values span a wide range
+- multimode: a few small integers, e.g. an operating mode
+
+Types cannot be determined from values alone, generated entries are a
+starting point to review against Moja Orca. Slovenian names are taken from
+menu_to_field.yaml where it knows the tag.
+
+Usage (from the repository root):
+
+    python development_resources/dump_all/tag_catalog.py scan.ndjson.gz [more dumps]
+        [--catalog catalog.json] [--config new_tags.yml] [--prefix 2_Temp]
+        [--include-known]
+"""
+
+import argparse
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import gzip
+import json
+import mmap
+from pathlib import Path
+import re
+import sys
+from typing import Any
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from orca_loader import CONFIG_PATH, load  # noqa: E402
+
+models = load("models")
+
+RESOURCES = Path(__file__).resolve().parents[1]
+MENU_PATH = RESOURCES / "menu_to_field.yaml"
+
+NO_VALUE = "-9999"
+# distinct values kept per tag, enough to list the modes of a multimode tag
+MAX_DISTINCT = 32
+# at most this many distinct values, all within 0..ENUM_MAX_VALUE, look like modes
+ENUM_MAX_VALUES = 8
+ENUM_MAX_VALUE = 30
+
+_FLOAT_NAME = re.compile(
+    r"temp|poti|diferenca|histereza|kalibracija|moc|tlak|pretok", re.IGNORECASE
+)
+_CELSIUS_NAME = re.compile(r"temp|poti|diferenca|histereza|kalibracija", re.IGNORECASE)
+_CIRCUIT_NAME = re.compile(r"MK_?(\d)|MP(\d)")
+_PREFIX = re.compile(r"^(\d+_|MK\d+_|SV_)")
+
+
+# One entry in any of the dump formats, found by a single scan over the file:
+# a raw readTags entry "#<tag>\tS_OK\n<quality>\t<value>" (fields may be
+# separated by ";"), a "<tag>: <value>" line or an NDJSON record
+_ENTRY = re.compile(
+    rb"#([^\t\n;#]*)[\t;]S_OK\r?[\t\n;][^\t\n;#]*[\t;]([^\t\n;#\r]*)"
+    rb"|^([^\s:#{]+): ([^\r\n]*)"
+    rb"|^(\{[^\r\n]*)",
+    re.MULTILINE,
+)
+
+
+def iter_entries(path: Path) -> Iterator[tuple[str, str]]:
+    """Yields (tag, raw value) pairs of a dump or scan, streaming."""
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as file:
+            for line in file:
+                yield from _parse(line)
+        return
+    with open(path, "rb") as file:
+        if path.stat().st_size == 0:
+            return
+        # the regex scans the mapped file, pages are read in as it proceeds
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _parse(mapped)
+
+
+def _parse(data: bytes | mmap.mmap) -> Iterator[tuple[str, str]]:
+    for match in _ENTRY.finditer(data):
+        raw_tag, raw_value, tag, value, record = match.groups()
+        if record:
+            parsed = json.loads(record)
+            yield parsed["tag"], parsed["value"]
+        elif raw_tag is not None:
+            yield raw_tag.decode(errors="replace"), raw_value.decode(errors="replace")
+        else:
+            yield tag.decode(errors="replace"), value.decode(errors="replace")
+
+
+@dataclass
+class TagStats:
+    """What was observed about one tag over all snapshots."""
+
+    snapshots: int = 0
+    # value differed from the one in the previous snapshot the tag was in
+    changes: int = 0
+    unavailable: int = 0
+    last: str | None = None
+    distinct: set[str] = field(default_factory=set)
+    # more than MAX_DISTINCT distinct values were seen
+    many_values: bool = False
+    minimum: int | None = None
+    maximum: int | None = None
+    integer: bool = True
+
+    def add(self, value: str) -> None:
+        if self.snapshots and value != self.last:
+            self.changes += 1
+        self.snapshots += 1
+        self.last = value
+        if value == NO_VALUE:
+            self.unavailable += 1
+            return
+        if len(self.distinct) < MAX_DISTINCT:
+            self.distinct.add(value)
+        elif value not in self.distinct:
+            self.many_values = True
+        try:
+            number = int(value)
+        except ValueError:
+            self.integer = False
+            return
+        self.minimum = number if self.minimum is None else min(self.minimum, number)
+        self.maximum = number if self.maximum is None else max(self.maximum, number)
+
+    @property
+    def volatility(self) -> float | None:
+        """Share of snapshots in which the value changed, None for a single one."""
+        if self.snapshots < 2:
+            return None
+        return self.changes / (self.snapshots - 1)
+
+    def guess_type(self, tag: str) -> tuple[str | None, str]:
+        """Returns the likely config.yml type and why, None if there is no guess."""
+        if self.minimum is None:
+            return None, "no value seen"
+        if not self.integer:
+            return None, "not an integer"
+        if self.distinct <= {"0", "1"}:
+            return "boolean", "only 0 and 1 seen"
+        if _FLOAT_NAME.search(tag):
+            return "float", "name suggests a measurement"
+        if (
+            not self.many_values
+            and len(self.distinct) <= ENUM_MAX_VALUES
+            and 0 <= self.minimum
+            and self.maximum <= ENUM_MAX_VALUE
+        ):
+            return "multimode", f"{len(self.distinct)} small values"
+        return "float", "wide range of values"
+
+    def as_dict(self, tag: str) -> dict[str, Any]:
+        guess, reason = self.guess_type(tag)
+        return {
+            "snapshots": self.snapshots,
+            "volatility": self.volatility,
+            "unavailable": self.unavailable,
+            "min": self.minimum,
+            "max": self.maximum,
+            "values": sorted(self.distinct, key=_numeric_key),
+            "many_values": self.many_values,
+            "type": guess,
+            "reason": reason,
+        }
+
+
+def _numeric_key(value: str) -> tuple[int, float | str]:
+    try:
+        return 0, float(value)
+    except ValueError:
+        return 1, value
+
+
+class TagCatalog:
+    """Tags of several snapshots, indexed by prefix."""
+
+    def __init__(self) -> None:
+        self.tags: dict[str, TagStats] = {}
+        self.snapshots: list[str] = []
+
+    def add_snapshot(self, path: Path) -> int:
+        """Adds the tags of one dump or scan, returns the number of entries read."""
+        self.snapshots.append(str(path))
+        count = 0
+        tags = self.tags
+        for tag, value in iter_entries(path):
+            if (stats := tags.get(tag)) is None:
+                stats = tags[tag] = TagStats()
+            stats.add(value)
+            count += 1
+        return count
+
+    def prefix_index(self) -> dict[str, list[str]]:
+        """Tags grouped by their first two name components, e.g. "2_Temp"."""
+        index: dict[str, list[str]] = {}
+        for tag in sorted(self.tags):
+            key = "_".join(tag.split("_", 2)[:2])
+            index.setdefault(key, []).append(tag)
+        return index
+
+    def select(self, prefixes: Iterable[str]) -> list[str]:
+        """Tags starting with any of prefixes, all tags without prefixes."""
+        prefixes = tuple(prefixes)
+        return [tag for tag in sorted(self.tags) if not prefixes or tag.startswith(prefixes)]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "snapshots": self.snapshots,
+            "prefixes": self.prefix_index(),
+            "tags": {tag: stats.as_dict(tag) for tag, stats in sorted(self.tags.items())},
+        }
+
+
+def menu_labels(path: Path = MENU_PATH) -> dict[str, str]:
+    """Slovenian UI labels by tag, from "label:: tag" lines."""
+    labels = {}
+    for line in path.read_text(encoding="utf8").splitlines():
+        label, sep, tag = line.partition("::")
+        if sep and tag.strip():
+            labels.setdefault(tag.strip(), label.strip().rstrip(":"))
+    return labels
+
+
+def config_entry(
+    tag: str, stats: TagStats, used_ids: set[tuple[str, int]], labels: dict[str, str]
+) -> dict[str, Any] | None:
+    """A config.yml item for tag, validated with models.py, None without a type guess."""
+    kind, _ = stats.guess_type(tag)
+    if kind is None:
+        return None
+    stem = _PREFIX.sub("", tag)
+    circuit = _heating_circuit(tag)
+    base_id = re.sub(r"[^a-z0-9]+", "_", stem.lower()).strip("_")
+    unique_id, suffix = base_id, 2
+    while (unique_id, circuit) in used_ids:
+        unique_id, suffix = f"{base_id}_{suffix}", suffix + 1
+    used_ids.add((unique_id, circuit))
+
+    item: dict[str, Any] = {
+        "tag": tag,
+        "id": unique_id,
+        "name": {"en": stem.replace("_", " ").lower(), "si": labels.get(tag, stem)},
+        "description": "",
+        "type": kind,
+    }
+    if kind == "float":
+        item["unit"] = "°C" if _CELSIUS_NAME.search(tag) else ""
+    elif kind == "multimode":
+        item["value_map"] = {int(value): value for value in sorted(stats.distinct, key=int)}
+    item["adjustable"] = {"enabled": False}
+    item["heating_circuit"] = circuit
+    if stats.volatility == 0:
+        # same value in every snapshot, probably a setting
+        item["poll_tier"] = "slow"
+    _validate(item)
+    return item
+
+
+def _heating_circuit(tag: str) -> int:
+    if match := _CIRCUIT_NAME.search(tag):
+        return int(match.group(1) or match.group(2))
+    if "SV" in tag or "sanit" in tag.lower():
+        return 4
+    if "kolekt" in tag.lower() or "solar" in tag.lower():
+        return 3
+    return 0
+
+
+def _validate(item: dict[str, Any]) -> None:
+    model = {
+        "float": models.FloatSensor,
+        "boolean": models.BooleanSensor,
+        "multimode": models.MultimodeSensor,
+    }[item["type"]]
+    model.model_validate(item)
+
+
+def format_entry(item: dict[str, Any], stats: TagStats) -> str:
+    """Formats item the way config.yml is written, with the observations as comment."""
+    guess, reason = stats.guess_type(item["tag"])
+    observed = (
+        f"# {guess}: {reason}; values {stats.minimum}..{stats.maximum}"
+        f" in {stats.snapshots} snapshot(s)"
+    )
+    if stats.volatility is not None:
+        observed += f", volatility {stats.volatility:.2f}"
+    lines = [observed, f"- tag: {item['tag']}", f"  id: {item['id']}", "  name:"]
+    for language, name in item["name"].items():
+        lines.append(f"    {language}: {json.dumps(name, ensure_ascii=False)}")
+    lines.append('  description: ""')
+    lines.append(f'  type: "{item["type"]}"')
+    if "unit" in item:
+        lines.append(f"  unit: {json.dumps(item['unit'], ensure_ascii=False)}")
+    if "value_map" in item:
+        lines.append("  value_map: # TODO name the modes")
+        lines += [f'    {key}: "{value}"' for key, value in item["value_map"].items()]
+    lines += ["  adjustable:", "    enabled: false"]
+    lines.append(f"  heating_circuit: {item['heating_circuit']}")
+    if "poll_tier" in item:
+        lines.append(f"  poll_tier: {item['poll_tier']}")
+    return "\n".join(lines) + "\n"
+
+
+def known_config() -> tuple[set[str], set[tuple[str, int]]]:
+    """Tags and (id, heating_circuit) pairs already in config.yml."""
+    tags, ids = set(), set()
+    for item in yaml.safe_load(CONFIG_PATH.read_text(encoding="utf8")):
+        if "tag" in item:
+            tags.add(item["tag"])
+            ids.add((item["id"], item["heating_circuit"]))
+    return tags, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dumps", type=Path, nargs="+", help="dumps or scans, oldest first")
+    parser.add_argument("--catalog", type=Path, help="write the catalog as JSON")
+    parser.add_argument("--config", type=Path, help="write config.yml entries")
+    parser.add_argument("--prefix", action="append", default=[], help="only these tags")
+    parser.add_argument(
+        "--include-known", action="store_true", help="also tags already in config.yml"
+    )
+    args = parser.parse_args()
+
+    catalog = TagCatalog()
+    for path in args.dumps:
+        entries = catalog.add_snapshot(path)
+        print(f"{path}: {entries} entries", file=sys.stderr)
+    print(
+        f"{len(catalog.tags)} tags in {len(catalog.prefix_index())} prefix groups",
+        file=sys.stderr,
+    )
+
+    if args.catalog:
+        args.catalog.write_text(json.dumps(catalog.as_dict(), indent=1, ensure_ascii=False))
+    if args.config:
+        known_tags, used_ids = known_config()
+        labels = menu_labels()
+        entries, skipped = [], 0
+        for tag in catalog.select(args.prefix):
+            if tag in known_tags and not args.include_known:
+                continue
+            stats = catalog.tags[tag]
+            if (item := config_entry(tag, stats, used_ids, labels)) is None:
+                skipped += 1
+                continue
+            entries.append(format_entry(item, stats))
+        args.config.write_text("\n".join(entries), encoding="utf8")
+        print(
+            f"{len(entries)} entries written to {args.config}, {skipped} tags without a guess",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()